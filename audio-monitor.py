@@ -4,12 +4,16 @@ Audio level monitor - writes mic levels to a JSON file for the PNGtuber.
 
 Usage:
     pip install sounddevice
+    pip install numba  # optional, JIT-compiles the level computation
     python audio-monitor.py
 
 The PNGtuber HTML polls audio-levels.json to animate based on volume.
 """
 
+import array
 import json
+import os
+import threading
 import time
 from pathlib import Path
 
@@ -23,19 +27,93 @@ except ImportError:
     import sounddevice as sd
     import numpy as np
 
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 OUTPUT_FILE = Path(__file__).parent / "assets" / "audio-levels.json"
 SAMPLE_RATE = 44100
 BLOCK_SIZE = 1024
+WRITE_INTERVAL = 0.1  # seconds between audio-levels.json writes
+UNCHANGED_REWRITE_INTERVAL = 1.0  # refresh the timestamp at least this often
+# Each update is written here first, then renamed over OUTPUT_FILE
+TMP_FILE = OUTPUT_FILE.with_suffix(".tmp")
+
+# Latest volume, written by the audio callback and read by the writer thread.
+# A single-slot array keeps the callback free of locks and allocations.
+_level = array.array("d", [0.0])
+
+
+if njit is not None:
+    @njit("float32(float32[::1])", cache=True, fastmath=True)
+    def _block_norm(samples):
+        """L2 norm of a contiguous float32 block."""
+        total = np.float32(0.0)
+        for x in samples:
+            total += x * x
+        return np.sqrt(total)
+
+    # Compile now so the first audio callback isn't stalled by the JIT
+    _block_norm(np.zeros(BLOCK_SIZE, dtype=np.float32))
+else:
+    def _block_norm(samples):
+        """L2 norm of a contiguous float32 block."""
+        return float(np.sqrt(samples.dot(samples)))
 
 
 def get_volume(indata, frames, time_info, status):
-    """Callback to process audio and calculate volume."""
-    volume = float(np.linalg.norm(indata) * 10)
-    volume = min(100.0, volume)  # Cap at 100
+    """Callback to process audio and calculate volume.
+
+    Runs on the PortAudio thread, so it only stores the level - file I/O
+    happens in level_writer().
+    """
+    samples = np.ascontiguousarray(indata, dtype=np.float32).ravel()
+    _level[0] = float(_block_norm(samples)) * 10
+
 
-    # Write to file
-    with open(OUTPUT_FILE, 'w') as f:
-        json.dump({"volume": round(volume, 2), "timestamp": time.time()}, f)
+def write_levels(volume: float) -> None:
+    """Atomically replace OUTPUT_FILE with the given (rounded) volume.
+
+    The PNGtuber page fetches the file over http.server at any moment, so
+    it must only ever see a complete record: write a temp file, then
+    os.replace it into place.
+    """
+    payload = json_dumps({"volume": volume, "timestamp": time.time()})
+    fd = os.open(TMP_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    os.replace(TMP_FILE, OUTPUT_FILE)
+
+
+def level_writer(stop: threading.Event) -> None:
+    """Write the latest level to OUTPUT_FILE every WRITE_INTERVAL seconds.
+
+    Unchanged volumes (e.g. while silent) are only rewritten every
+    UNCHANGED_REWRITE_INTERVAL seconds to keep the timestamp fresh.
+    """
+    last_volume = None
+    last_written = 0.0
+    while not stop.wait(WRITE_INTERVAL):
+        volume = round(min(100.0, _level[0]), 2)  # Cap at 100
+        now = time.monotonic()
+        if volume == last_volume and now - last_written < UNCHANGED_REWRITE_INTERVAL:
+            continue
+        try:
+            write_levels(volume)
+        except OSError as e:
+            print(f"Error writing levels: {e}")
+            continue
+        last_volume = volume
+        last_written = now
 
 
 def main():
@@ -54,6 +132,10 @@ def main():
     print(f"Using: {device_info['name']}")
     print()
 
+    stop = threading.Event()
+    writer = threading.Thread(target=level_writer, args=(stop,), daemon=True)
+    writer.start()
+
     try:
         with sd.InputStream(callback=get_volume,
                           device=device_id,
@@ -65,6 +147,8 @@ def main():
                 time.sleep(0.1)
     except KeyboardInterrupt:
         print("\nStopped.")
+    finally:
+        stop.set()
 
 
 if __name__ == "__main__":
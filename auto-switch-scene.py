@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Auto-switch OBS scene after countdown timer ends."""
 
+import math
 import time
 import obsws_python as obs
 
@@ -10,13 +11,12 @@ TARGET_SCENE = "vibe-coding-main"
 def main():
     print(f"Waiting {DELAY_SECONDS} seconds ({DELAY_SECONDS // 60} minutes) before switching to '{TARGET_SCENE}'...")
 
-    # Countdown display
-    remaining = DELAY_SECONDS
-    while remaining > 0:
-        mins, secs = divmod(remaining, 60)
+    # Countdown display, timed against a monotonic deadline so sleeps can't drift
+    end = time.monotonic() + DELAY_SECONDS
+    while (remaining := end - time.monotonic()) > 0:
+        mins, secs = divmod(math.ceil(remaining), 60)
         print(f"\r  {mins:02d}:{secs:02d} remaining...", end="", flush=True)
-        time.sleep(1)
-        remaining -= 1
+        time.sleep(remaining % 1 or 1)  # Wake when the displayed second changes
 
     print(f"\n\nTimer complete! Switching to '{TARGET_SCENE}'...")
 
@@ -18,18 +18,36 @@ import obsws_python as obs
 OBS_HOST = os.environ.get("OBS_HOST", "localhost")
 OBS_PORT = int(os.environ.get("OBS_PORT", "4455"))
 OBS_PASSWORD = os.environ.get("OBS_PASSWORD", "")
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
 
 SCAN_INTERVAL = 3  # seconds
 FONT_SIZE = 48
 OVERLAY_SOURCE = "mcp-translation-overlay"
 
 last_translation = ""
+_client = None  # Shared OBS connection, reopened after a failure
+
+def get_client():
+    """Get or create the shared OBS client connection."""
+    global _client
+    if _client is None:
+        _client = obs.ReqClient(host=OBS_HOST, port=OBS_PORT, password=OBS_PASSWORD)
+    return _client
+
+def reset_client():
+    """Drop the shared OBS connection so the next call reconnects."""
+    global _client
+    if _client is not None:
+        try:
+            _client.disconnect()
+        except Exception:
+            pass
+    _client = None
 
 def get_screenshot():
     """Capture OBS screenshot and return base64 PNG."""
-    client = obs.ReqClient(host=OBS_HOST, port=OBS_PORT, password=OBS_PASSWORD)
     try:
-        resp = client.get_source_screenshot(
+        resp = get_client().get_source_screenshot(
             name="",  # Empty = current scene
             img_format="png",
             width=1920,
@@ -37,8 +55,9 @@ def get_screenshot():
             quality=85
         )
         return resp.image_data.split(",", 1)[-1]  # Remove data:image/png;base64, prefix
-    finally:
-        client.disconnect()
+    except Exception:
+        reset_client()
+        raise
 
 def save_screenshot(b64_data, path="tmp/auto_screenshot.png"):
     """Save base64 screenshot to file."""
@@ -46,13 +65,37 @@ def save_screenshot(b64_data, path="tmp/auto_screenshot.png"):
     Path(path).write_bytes(base64.b64decode(b64_data))
     return path
 
+def capture_screenshot(path="tmp/auto_screenshot.png"):
+    """Capture OBS screenshot to a PNG file.
+
+    When OBS runs on this machine it writes the file itself, so the image
+    never crosses the websocket as base64.
+    """
+    if OBS_HOST not in LOCAL_HOSTS:
+        return save_screenshot(get_screenshot(), path)
+
+    Path(path).parent.mkdir(exist_ok=True)
+    try:
+        get_client().save_source_screenshot(
+            name="",  # Empty = current scene
+            img_format="png",
+            file_path=str(Path(path).resolve()),
+            width=1920,
+            height=1080,
+            quality=85
+        )
+        return path
+    except Exception:
+        reset_client()
+        raise
+
 def update_overlay(text):
     """Update the translation overlay text in OBS."""
     global last_translation
     if text == last_translation:
         return False
 
-    client = obs.ReqClient(host=OBS_HOST, port=OBS_PORT, password=OBS_PASSWORD)
+    client = get_client()
     try:
         # Try to update existing source
         try:
@@ -89,8 +132,9 @@ def update_overlay(text):
 
         last_translation = text
         return True
-    finally:
-        client.disconnect()
+    except Exception:
+        reset_client()
+        raise
 
 def main():
     print(f"Auto-translate started - scanning every {SCAN_INTERVAL} seconds", flush=True)
@@ -102,8 +146,7 @@ def main():
     while True:
         try:
             # Capture screenshot
-            b64_data = get_screenshot()
-            save_screenshot(b64_data, screenshot_path)
+            capture_screenshot(screenshot_path)
             print(f"[{time.strftime('%H:%M:%S')}] Screenshot captured, saved to {screenshot_path}", flush=True)
             print("  -> Send to Claude for OCR/translation via MCP tool", flush=True)
 
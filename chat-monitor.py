@@ -2,9 +2,11 @@
 """Monitor chat for obs-twitch-mcp mentions and auto-respond with repo link."""
 
 import json
+import mmap
 import os
 import time
 import re
+from collections import OrderedDict
 from pathlib import Path
 
 # Add src to path for imports
@@ -13,6 +15,16 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from utils.twitch_client import TwitchClient
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 TRIGGER_PATTERNS = [
     r'obs-twitch-mcp',
     r'obs twitch mcp',
@@ -33,54 +45,163 @@ BAN_PATTERNS = [
     r'wanna become famous',
 ]
 
+def _record_match(pattern_id, start, end, flags, hits):
+    hits.append(pattern_id)
+
+def compile_patterns(patterns):
+    """Build a case-insensitive "matches any pattern" test.
+
+    Uses a Hyperscan database (one DFA scan over the bytes) when the
+    hyperscan package is installed, else a single compiled alternation.
+    """
+    if hyperscan is not None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+        )
+
+        def matches(text):
+            hits = []
+            db.scan(text.encode(), match_event_handler=_record_match, context=hits)
+            return bool(hits)
+        return matches
+
+    regex = re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+    return lambda text: regex.search(text) is not None
+
+matches_trigger = compile_patterns(TRIGGER_PATTERNS)
+matches_ban = compile_patterns(BAN_PATTERNS)
+
 CHAT_LOG_DIR = Path(__file__).parent / "chat_logs"
 RESPONDED_FILE = Path(__file__).parent / "tmp" / "responded_messages.json"
 
+RESPONDED_LIMIT = 10_000  # Most recent message ids remembered across restarts
+
+class LRUSet:
+    """Set that keeps only the `maxsize` most recently added items."""
+
+    def __init__(self, items=(), maxsize=RESPONDED_LIMIT):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, item):
+        self._items[item] = None
+        self._items.move_to_end(item)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
 def load_responded():
-    if RESPONDED_FILE.exists():
-        return set(json.loads(RESPONDED_FILE.read_text()))
-    return set()
+    """Load responded message ids, compacting the file if it has grown past the limit."""
+    if not RESPONDED_FILE.exists():
+        return LRUSet()
+    text = RESPONDED_FILE.read_text()
+    if text.startswith('['):  # Older files stored a JSON list
+        ids = json.loads(text)
+    else:
+        ids = text.splitlines()
+    responded = LRUSet(ids)
+    if len(ids) > len(responded) or text.startswith('['):
+        save_responded(responded)
+    return responded
 
 def save_responded(responded):
+    """Atomically write responded message ids, one per line."""
+    RESPONDED_FILE.parent.mkdir(exist_ok=True)
+    tmp_file = RESPONDED_FILE.with_suffix('.tmp')
+    tmp_file.write_text(''.join(f"{msg_id}\n" for msg_id in responded))
+    os.replace(tmp_file, RESPONDED_FILE)
+
+def append_responded(msg_ids):
+    """Append newly responded message ids to the file."""
     RESPONDED_FILE.parent.mkdir(exist_ok=True)
-    RESPONDED_FILE.write_text(json.dumps(list(responded)))
+    with open(RESPONDED_FILE, 'a') as f:
+        f.write(''.join(f"{msg_id}\n" for msg_id in msg_ids))
+
+def _tail_offset(fh, limit):
+    """Byte offset where the last `limit` complete lines of fh start.
+
+    Scans backwards over an mmap of the file, so opening a large log
+    doesn't read and split all of it.
+    """
+    if os.fstat(fh.fileno()).st_size == 0:
+        return 0
+    with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = mm.rfind(b'\n')  # End of the last complete line
+        for _ in range(limit):
+            if pos == -1:
+                return 0
+            pos = mm.rfind(b'\n', 0, pos)
+        return pos + 1
+
+# Tail state for the newest chat log, so each poll only reads appended bytes
+_tail = {"path": None, "fh": None, "inode": None, "partial": b""}
 
 def get_latest_messages(limit=20):
+    """Return messages appended to the newest chat log since the last call.
+
+    The first read of a log file (including after a day rollover or the
+    file being replaced) returns only its last `limit` messages.
+    """
     if not CHAT_LOG_DIR.exists():
         return []
     log_files = sorted(CHAT_LOG_DIR.glob("*.jsonl"), reverse=True)
     if not log_files:
         return []
+    log_file = log_files[0]
+    st = os.stat(log_file)
+    fh = _tail["fh"]
+    reopened = (
+        fh is None
+        or _tail["path"] != log_file
+        or _tail["inode"] != st.st_ino
+        or st.st_size < fh.tell()
+    )
+    if reopened:
+        if fh is not None:
+            fh.close()
+        fh = open(log_file, 'rb')
+        fh.seek(_tail_offset(fh, limit))
+        _tail.update(path=log_file, fh=fh, inode=os.fstat(fh.fileno()).st_ino, partial=b"")
+
+    lines = (_tail["partial"] + fh.read()).split(b'\n')
+    _tail["partial"] = lines.pop()  # Incomplete last line, finished on a later poll
+    if reopened:
+        lines = lines[-limit:]
+
     messages = []
-    for log_file in log_files[:1]:
-        lines = log_file.read_text().strip().split('\n')
-        for line in lines[-limit:]:
-            try:
-                messages.append(json.loads(line))
-            except:
-                pass
+    for line in lines:
+        try:
+            messages.append(json_loads(line))
+        except:
+            pass
     return messages
 
 def should_respond(message_text, username):
     if username.lower() == "struktured":
         if "github.com/struktured-labs/obs-twitch-mcp" in message_text:
             return False
-    text_lower = message_text.lower()
-    for pattern in TRIGGER_PATTERNS:
-        if re.search(pattern, text_lower):
-            return True
-    return False
+    return matches_trigger(message_text)
 
 def should_ban(message_text, username):
     """Check if message matches spam bot patterns."""
     # Don't ban mods/broadcaster
     if username.lower() in ["struktured", "nightbot", "streamelements"]:
         return False
-    text_lower = message_text.lower()
-    for pattern in BAN_PATTERNS:
-        if re.search(pattern, text_lower):
-            return True
-    return False
+    return matches_ban(message_text)
 
 def main():
     print("Chat Monitor Started - watching for obs-twitch-mcp mentions...", flush=True)
@@ -111,9 +232,11 @@ def main():
     )
     print("TwitchClient created, starting monitor loop...", flush=True)
     responded = load_responded()
+    appended = 0  # Lines appended to RESPONDED_FILE since it was last compacted
 
     while True:
         try:
+            new_ids = []
             messages = get_latest_messages(20)
             for msg in messages:
                 msg_id = msg.get("message_id", "")
@@ -131,7 +254,7 @@ def main():
                     except Exception as e:
                         print(f"Failed to ban {username}: {e}", flush=True)
                     responded.add(msg_id)
-                    save_responded(responded)
+                    new_ids.append(msg_id)
                     continue
 
                 # Check for repo questions
@@ -141,7 +264,15 @@ def main():
                     client.send_chat_message(reply)
                     print(f"Responded: {reply}", flush=True)
                     responded.add(msg_id)
+                    new_ids.append(msg_id)
+            if new_ids:
+                appended += len(new_ids)
+                if appended > responded.maxsize:
+                    # Rewrite from the capped set so the file can't grow forever
                     save_responded(responded)
+                    appended = 0
+                else:
+                    append_responded(new_ids)
             time.sleep(3)
         except KeyboardInterrupt:
             print("\nStopping chat monitor...", flush=True)
@@ -6,21 +6,34 @@ Serves messages via Server-Sent Events for the overlay.
 
 import asyncio
 import json
+import logging
 import os
-import re
 import ssl
 import sys
-import traceback
+import time
 from aiohttp import web
 from collections import deque
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    json_loads = json.loads
+
 # Config
 CHANNEL = os.getenv("TWITCH_CHANNEL", "struktured")
 TOKEN_FILE = Path(__file__).parent / ".twitch_token.json"
+# Served with FileResponse, which uses sendfile and returns 404 for missing files
+ASSETS_DIR = Path(__file__).parent / "assets"
 PORT = 8765
+IRC_ERROR_LOG_INTERVAL = 30  # Seconds between tracebacks for the same error type
+
+log = logging.getLogger("chat-server")
+_last_irc_error: dict[str, float] = {}
 
 
 def get_oauth_token() -> str:
@@ -41,9 +54,39 @@ def get_oauth_token() -> str:
     return env_token
 
 
-# Message queue for connected clients
+# Recent messages, replayed to new SSE clients and served by /chat
 message_queue: deque = deque(maxlen=50)
-connected_clients: list[asyncio.Queue] = []
+
+
+class SSEBroadcaster:
+    """Fan out encoded SSE frames to every client from one shared buffer.
+
+    Each frame is stored once; clients track the sequence number they have
+    sent up to and catch up from the buffer when woken.
+    """
+
+    def __init__(self, maxlen: int = 256):
+        self.frames: deque[bytes] = deque(maxlen=maxlen)
+        self.seq = 0
+        self.clients = 0
+        self._event = asyncio.Event()
+
+    def publish(self, frame: bytes) -> None:
+        self.frames.append(frame)
+        self.seq += 1
+        self._event.set()
+        self._event.clear()
+
+    async def wait(self, last_seq: int) -> tuple[bytes, int]:
+        """Wait for frames after last_seq; return them joined and the new seq."""
+        while self.seq == last_seq:
+            await self._event.wait()
+        # A client that fell more than maxlen frames behind skips the oldest
+        missed = min(self.seq - last_seq, len(self.frames))
+        return b"".join(list(self.frames)[-missed:]), self.seq
+
+
+broadcaster = SSEBroadcaster()
 
 
 @dataclass
@@ -57,23 +100,47 @@ class ChatMessage:
     timestamp: str = ""
 
 
+_WANTED_TAGS = frozenset(("mod", "subscriber", "badges", "id"))
+
+
+def _extract_tags(tags_str: str) -> dict[str, str]:
+    """Pull only the IRCv3 tags we use, stopping once all have been seen."""
+    found = {}
+    for tag in tags_str.split(";"):
+        key, sep, value = tag.partition("=")
+        if sep and key in _WANTED_TAGS:
+            found[key] = value
+            if len(found) == len(_WANTED_TAGS):
+                break
+    return found
+
+
 def parse_irc_message(raw: str) -> ChatMessage | None:
     """Parse Twitch IRC message."""
-    privmsg_match = re.match(
-        r"(?:@(\S+)\s+)?:(\w+)!\w+@\w+\.tmi\.twitch\.tv\s+PRIVMSG\s+#(\w+)\s+:(.+)",
-        raw.strip()
-    )
-    if not privmsg_match:
+    # Most IRC traffic (PING, JOIN, numerics) bails out on this one scan
+    if " PRIVMSG #" not in raw:
         return None
 
-    tags_str, username, channel, message = privmsg_match.groups()
+    line = raw.strip()
+    tags_str = ""
+    if line.startswith("@"):
+        tags_str, _, line = line[1:].partition(" ")
+    if not line.startswith(":"):
+        return None
+
+    prefix, _, rest = line[1:].partition(" PRIVMSG #")
+    username = prefix.partition("!")[0]
+    channel, _, message = rest.partition(" :")
+    if not username or not channel or not message:
+        return None
 
     is_mod = False
     is_sub = False
-    msg_id = datetime.now().isoformat()
+    now_iso = datetime.now().isoformat()
+    msg_id = now_iso
 
     if tags_str:
-        tags = dict(t.split("=", 1) for t in tags_str.split(";") if "=" in t)
+        tags = _extract_tags(tags_str)
         is_mod = tags.get("mod") == "1" or "broadcaster" in tags.get("badges", "")
         is_sub = tags.get("subscriber") == "1"
         msg_id = tags.get("id", msg_id)
@@ -85,10 +152,15 @@ def parse_irc_message(raw: str) -> ChatMessage | None:
         is_mod=is_mod,
         is_subscriber=is_sub,
         is_broadcaster=username.lower() == CHANNEL.lower(),
-        timestamp=datetime.now().isoformat(),
+        timestamp=now_iso,
     )
 
 
+def sse_frame(msg_dict: dict) -> bytes:
+    """Encode a message as a Server-Sent Events data frame."""
+    return b"data: " + json_dumps(msg_dict) + b"\n\n"
+
+
 async def irc_listener():
     """Connect to Twitch IRC and broadcast messages."""
     token = get_oauth_token()
@@ -119,7 +191,7 @@ async def irc_listener():
 
             print(f"Sent auth commands, waiting for response...")
 
-            buffer = ""
+            buffer = b""
             authenticated = False
 
             while True:
@@ -129,47 +201,46 @@ async def irc_listener():
                         print("Connection closed by server (no data)")
                         break
 
-                    buffer += data.decode("utf-8", errors="ignore")
+                    # Keep the buffer as bytes; only chat lines get decoded
+                    buffer += data
 
-                    while "\r\n" in buffer:
-                        line, buffer = buffer.split("\r\n", 1)
+                    while b"\r\n" in buffer:
+                        line, buffer = buffer.split(b"\r\n", 1)
 
                         # Debug: print all IRC messages
                         if not authenticated:
-                            print(f"IRC: {line[:100]}")
+                            print(f"IRC: {line[:100].decode('utf-8', errors='ignore')}")
 
                         # Check for auth success
-                        if "Welcome, GLHF!" in line:
+                        if b"Welcome, GLHF!" in line:
                             authenticated = True
                             reconnect_delay = 1
                             print(f"✓ Connected to #{CHANNEL}!")
 
                         # Respond to PING
-                        if line.startswith("PING"):
+                        if line.startswith(b"PING"):
                             writer.write(b"PONG :tmi.twitch.tv\r\n")
                             await writer.drain()
                             continue
 
                         # Check for auth failure
-                        if "Login authentication failed" in line:
+                        if b"Login authentication failed" in line:
                             print("ERROR: Authentication failed! Token may be expired.")
                             print("Run: uv run python auth.py")
                             await asyncio.sleep(60)  # Wait before retry
                             break
 
                         # Parse chat messages
-                        msg = parse_irc_message(line)
+                        if b" PRIVMSG #" not in line:
+                            continue
+                        msg = parse_irc_message(line.decode("utf-8", errors="ignore"))
                         if msg:
                             msg_dict = asdict(msg)
                             message_queue.append(msg_dict)
                             print(f"💬 {msg.username}: {msg.message[:50]}")
 
-                            # Broadcast to SSE clients
-                            for client_queue in connected_clients:
-                                try:
-                                    client_queue.put_nowait(msg_dict)
-                                except asyncio.QueueFull:
-                                    pass
+                            # Broadcast to SSE clients, serialized once for all of them
+                            broadcaster.publish(sse_frame(msg_dict))
 
                 except asyncio.TimeoutError:
                     # Send ping to keep connection alive
@@ -182,7 +253,14 @@ async def irc_listener():
             raise
         except Exception as e:
             print(f"IRC error: {e}")
-            traceback.print_exc()
+            # Only log a full traceback once per error type per interval,
+            # so a reconnect storm doesn't flood stderr
+            error_type = type(e).__name__
+            now = time.monotonic()
+            last = _last_irc_error.get(error_type)
+            if last is None or now - last >= IRC_ERROR_LOG_INTERVAL:
+                _last_irc_error[error_type] = now
+                log.warning("IRC error", exc_info=True)
 
         finally:
             if writer:
@@ -207,23 +285,23 @@ async def handle_sse(request):
     response.headers["Access-Control-Allow-Origin"] = "*"
     await response.prepare(request)
 
-    client_queue = asyncio.Queue(maxsize=100)
-    connected_clients.append(client_queue)
-    print(f"SSE client connected (total: {len(connected_clients)})")
-
-    # Send recent messages first
-    for msg in list(message_queue)[-20:]:
-        await response.write(f"data: {json.dumps(msg)}\n\n".encode())
+    last_seq = broadcaster.seq
+    broadcaster.clients += 1
+    print(f"SSE client connected (total: {broadcaster.clients})")
 
     try:
+        # Send recent messages first
+        for msg in list(message_queue)[-20:]:
+            await response.write(sse_frame(msg))
+
         while True:
-            msg = await client_queue.get()
-            await response.write(f"data: {json.dumps(msg)}\n\n".encode())
+            frames, last_seq = await broadcaster.wait(last_seq)
+            await response.write(frames)
     except (asyncio.CancelledError, ConnectionResetError):
         pass
     finally:
-        connected_clients.remove(client_queue)
-        print(f"SSE client disconnected (total: {len(connected_clients)})")
+        broadcaster.clients -= 1
+        print(f"SSE client disconnected (total: {broadcaster.clients})")
 
     return response
 
@@ -240,33 +318,24 @@ async def handle_chat(request):
 async def handle_health(request):
     """Health check."""
     return web.json_response(
-        {"status": "ok", "clients": len(connected_clients), "messages": len(message_queue)},
+        {"status": "ok", "clients": broadcaster.clients, "messages": len(message_queue)},
         headers={"Access-Control-Allow-Origin": "*"}
     )
 
 
 async def handle_overlay(request):
     """Serve the chat overlay HTML."""
-    html_path = Path(__file__).parent / "assets" / "retro-chat.html"
-    if html_path.exists():
-        return web.FileResponse(html_path)
-    return web.Response(text="Overlay not found", status=404)
+    return web.FileResponse(ASSETS_DIR / "retro-chat.html")
 
 
 async def handle_countdown(request):
     """Serve the countdown timer HTML."""
-    html_path = Path(__file__).parent / "assets" / "countdown-timer.html"
-    if html_path.exists():
-        return web.FileResponse(html_path)
-    return web.Response(text="Countdown not found", status=404)
+    return web.FileResponse(ASSETS_DIR / "countdown-timer.html")
 
 
 async def handle_claude_badge(request):
     """Serve the Claude AI badge HTML."""
-    html_path = Path(__file__).parent / "assets" / "claude-badge.html"
-    if html_path.exists():
-        return web.FileResponse(html_path)
-    return web.Response(text="Badge not found", status=404)
+    return web.FileResponse(ASSETS_DIR / "claude-badge.html")
 
 
 async def start_background_tasks(app):
@@ -9,14 +9,27 @@ import base64
 import io
 import os
 import sys
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+import numpy as np
 from PIL import Image
 import obsws_python as obs
 
+try:
+    import cv2  # Optional: decodes screenshots without PIL/BytesIO
+except ImportError:
+    cv2 = None
+
+try:
+    from numba import njit  # Optional: JIT-compiles the pixel classifier
+except ImportError:
+    njit = None
+
 # Config - adjust these based on game capture position
 # Health bar region in the game (relative to blackmagic source)
 # Full res (1920x1080): X=430-479, Y=75-113
@@ -26,6 +39,17 @@ HEALTH_BAR_Y = 17   # 75/4.5
 HEALTH_BAR_WIDTH = 9   # 50/6
 HEALTH_BAR_HEIGHT = 9  # 39/4.5
 
+# Screenshot settings. OBS scales (not crops) to this size, so the health bar
+# coordinates above depend on it. BMP is uncompressed: no zlib encode in OBS
+# or decode here, which costs more than the extra base64 bytes at this size.
+SCREENSHOT_FORMAT = "bmp"
+SCREENSHOT_WIDTH = 320
+SCREENSHOT_HEIGHT = 240
+# Give up on a screenshot after this long (e.g. OBS busy in a transition) and
+# skip frames until it returns, rather than falling further behind
+SCREENSHOT_TIMEOUT = 0.4  # seconds
+SKIPPED_LOG_INTERVAL = 60  # seconds between skipped-frame reports
+
 # OBS connection
 OBS_HOST = os.getenv("OBS_WEBSOCKET_HOST", "localhost")
 OBS_PORT = int(os.getenv("OBS_WEBSOCKET_PORT", "4455"))
@@ -35,12 +59,19 @@ OBS_PASSWORD = os.getenv("OBS_WEBSOCKET_PASSWORD", "")
 panic_overlay_visible = False
 death_overlay_visible = False
 death_overlay_time = 0
-low_health_count = 0  # Consecutive low readings before triggering
-last_valid_health = 100  # Track last known valid health reading
 client = None
+scene_events = None  # OBS event client that invalidates the scene cache
+current_scene = None  # Cached program scene name
+scene_item_ids: dict[tuple[str, str], int] = {}  # (scene, source) -> scene item id
 DEATH_OVERLAY_DURATION = 20  # seconds
 LOW_HEALTH_THRESHOLD = 3  # Require 3 consecutive low readings to trigger
 MIN_VALID_HEALTH = 10  # Below this, assume health bar not visible
+DEBUG_LOG_INTERVAL = 5  # seconds between routine health log lines
+# Adaptive polling: back off while health is full and stable, react fast otherwise
+MIN_POLL_INTERVAL = 0.25  # seconds
+MAX_POLL_INTERVAL = 2.0  # seconds
+STABLE_HEALTH = 80  # Readings above this count as stable
+STABLE_READINGS = 4  # Stable readings in a row before backing off
 
 
 def get_obs_client():
@@ -50,32 +81,65 @@ def get_obs_client():
     return client
 
 
-def get_health_percentage(screenshot_data: bytes) -> float:
-    """Analyze screenshot to determine health percentage from green bar."""
-    img = Image.open(io.BytesIO(screenshot_data))
+# Scratch buffers reused across frames instead of reallocated every tick
+_png_buffer = io.BytesIO()
+_region_pixels = np.empty((HEALTH_BAR_HEIGHT, HEALTH_BAR_WIDTH, 3), dtype=np.int16)
+
+
+if njit is not None:
+    @njit("int64(int16[:, :, ::1])", cache=True)
+    def count_green(pixels):
+        """Count bright green pixels (g > 100, g > 1.5*r, g > 1.5*b) in an int16 RGB array."""
+        count = 0
+        for y in range(pixels.shape[0]):
+            for x in range(pixels.shape[1]):
+                r, g, b = pixels[y, x, 0], pixels[y, x, 1], pixels[y, x, 2]
+                if g > 100 and 2 * g > 3 * r and 2 * g > 3 * b:
+                    count += 1
+        return count
+
+    # Compile now so the first frame isn't stalled by the JIT
+    count_green(np.zeros((HEALTH_BAR_HEIGHT, HEALTH_BAR_WIDTH, 3), dtype=np.int16))
+else:
+    def count_green(pixels: np.ndarray) -> int:
+        """Count bright green pixels (g > 100, g > 1.5*r, g > 1.5*b) in an int16 RGB array."""
+        r, g, b = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+        return np.count_nonzero((g > 100) & (2 * g > 3 * r) & (2 * g > 3 * b))
 
-    # Crop to health bar region
+
+def get_health_region(screenshot_data: bytes) -> np.ndarray:
+    """Decode a screenshot and return the health bar region as an RGB array."""
     # The blackmagic source is in the upper-left of the scene
     # Health bar is in upper-left of game
+    if cv2 is not None:
+        img = cv2.imdecode(np.frombuffer(screenshot_data, np.uint8), cv2.IMREAD_COLOR)
+        region = img[
+            HEALTH_BAR_Y:HEALTH_BAR_Y + HEALTH_BAR_HEIGHT,
+            HEALTH_BAR_X:HEALTH_BAR_X + HEALTH_BAR_WIDTH,
+        ]
+        return region[..., ::-1]  # BGR -> RGB
+
+    _png_buffer.seek(0)
+    _png_buffer.truncate()
+    _png_buffer.write(screenshot_data)
+    _png_buffer.seek(0)
+    img = Image.open(_png_buffer)
     health_region = img.crop((
         HEALTH_BAR_X,
         HEALTH_BAR_Y,
         HEALTH_BAR_X + HEALTH_BAR_WIDTH,
         HEALTH_BAR_Y + HEALTH_BAR_HEIGHT
     ))
+    return np.asarray(health_region.convert("RGB"))
 
-    # Count green pixels
-    pixels = list(health_region.getdata())
-    green_count = 0
-    total_pixels = len(pixels)
 
-    for pixel in pixels:
-        if len(pixel) >= 3:
-            r, g, b = pixel[:3]
-            # Green health bar detection
-            # Looking for bright green pixels
-            if g > 100 and g > r * 1.5 and g > b * 1.5:
-                green_count += 1
+def get_health_percentage(screenshot_data: bytes) -> float:
+    """Analyze screenshot to determine health percentage from green bar."""
+    # int16 copy so 3*r in count_green doesn't overflow uint8
+    pixels = _region_pixels
+    np.copyto(pixels, get_health_region(screenshot_data), casting="unsafe")
+    total_pixels = pixels.shape[0] * pixels.shape[1]
+    green_count = int(count_green(pixels))
 
     # Calculate percentage based on green pixels
     if total_pixels == 0:
@@ -90,37 +154,88 @@ def get_health_percentage(screenshot_data: bytes) -> float:
     return min(100.0, health_pct * 2)
 
 
-def show_panic_overlay(obs_client):
-    """Show the panic overlay."""
-    global panic_overlay_visible
-    if panic_overlay_visible:
-        return
+def get_current_scene(obs_client):
+    """Current program scene, cached while OBS scene-change events are watched."""
+    global current_scene
+    if current_scene is None or scene_events is None:
+        current_scene = obs_client.get_current_program_scene().scene_name
+    return current_scene
 
+
+def invalidate_scene_cache():
+    """Forget the cached scene and overlay item ids."""
+    global current_scene
+    current_scene = None
+    scene_item_ids.clear()
+
+
+def on_current_program_scene_changed(data):
+    """OBS event callback: re-read the scene name on next use."""
+    global current_scene
+    current_scene = None
+
+
+def watch_scene_changes():
+    """Subscribe to scene changes so the cached scene name stays correct."""
     try:
-        scene = obs_client.get_current_program_scene().scene_name
+        events = obs.EventClient(host=OBS_HOST, port=OBS_PORT, password=OBS_PASSWORD)
+        events.callback.register(on_current_program_scene_changed)
+        return events
+    except Exception as e:
+        print(f"Scene change events unavailable, not caching scene name: {e}")
+        return None
 
-        # Create browser source for panic overlay
-        obs_client.create_input(
+
+def set_overlay_enabled(obs_client, source_name, enabled):
+    """Show or hide an overlay in the current scene using cached item ids."""
+    try:
+        scene = get_current_scene(obs_client)
+        item_id = scene_item_ids.get((scene, source_name))
+        if item_id is None:
+            item_id = obs_client.get_scene_item_id(scene, source_name).scene_item_id
+            scene_item_ids[(scene, source_name)] = item_id
+        obs_client.set_scene_item_enabled(scene, item_id, enabled)
+    except Exception:
+        invalidate_scene_cache()
+        raise
+
+
+def show_overlay(obs_client, source_name, asset):
+    """Enable an overlay, creating its browser source if needed."""
+    scene = get_current_scene(obs_client)
+    if (scene, source_name) in scene_item_ids:
+        set_overlay_enabled(obs_client, source_name, True)
+        return
+    try:
+        result = obs_client.create_input(
             scene,
-            "mcp-panic-overlay",
+            source_name,
             "browser_source",
             {
-                "url": f"file://{Path(__file__).parent}/assets/oh-crap-panic.html",
+                "url": f"file://{Path(__file__).parent}/assets/{asset}",
                 "width": 1920,
                 "height": 1080,
             },
             True,
         )
+        scene_item_ids[(scene, source_name)] = result.scene_item_id
+    except Exception:
+        # Source may already exist
+        set_overlay_enabled(obs_client, source_name, True)
+
+
+def show_panic_overlay(obs_client):
+    """Show the panic overlay."""
+    global panic_overlay_visible
+    if panic_overlay_visible:
+        return
+
+    try:
+        show_overlay(obs_client, "mcp-panic-overlay", "oh-crap-panic.html")
         panic_overlay_visible = True
         print("PANIC! Health critical - showing overlay")
     except Exception as e:
-        # Source may already exist
-        try:
-            item_id = obs_client.get_scene_item_id(scene, "mcp-panic-overlay").scene_item_id
-            obs_client.set_scene_item_enabled(scene, item_id, True)
-            panic_overlay_visible = True
-        except Exception:
-            print(f"Error showing panic overlay: {e}")
+        print(f"Error showing panic overlay: {e}")
 
 
 def hide_panic_overlay(obs_client):
@@ -130,9 +245,7 @@ def hide_panic_overlay(obs_client):
         return
 
     try:
-        scene = obs_client.get_current_program_scene().scene_name
-        item_id = obs_client.get_scene_item_id(scene, "mcp-panic-overlay").scene_item_id
-        obs_client.set_scene_item_enabled(scene, item_id, False)
+        set_overlay_enabled(obs_client, "mcp-panic-overlay", False)
         panic_overlay_visible = False
         print("Health recovered - hiding overlay")
     except Exception as e:
@@ -142,7 +255,6 @@ def hide_panic_overlay(obs_client):
 def show_death_overlay(obs_client):
     """Show the F death overlay."""
     global death_overlay_visible, death_overlay_time
-    import time
 
     if death_overlay_visible:
         return
@@ -151,30 +263,12 @@ def show_death_overlay(obs_client):
     hide_panic_overlay(obs_client)
 
     try:
-        scene = obs_client.get_current_program_scene().scene_name
-
-        obs_client.create_input(
-            scene,
-            "mcp-death-overlay",
-            "browser_source",
-            {
-                "url": f"file://{Path(__file__).parent}/assets/f-to-pay-respects.html",
-                "width": 1920,
-                "height": 1080,
-            },
-            True,
-        )
+        show_overlay(obs_client, "mcp-death-overlay", "f-to-pay-respects.html")
         death_overlay_visible = True
-        death_overlay_time = time.time()
+        death_overlay_time = time.monotonic()
         print("☠️ DEATH! F to pay respects...")
     except Exception as e:
-        try:
-            item_id = obs_client.get_scene_item_id(scene, "mcp-death-overlay").scene_item_id
-            obs_client.set_scene_item_enabled(scene, item_id, True)
-            death_overlay_visible = True
-            death_overlay_time = time.time()
-        except Exception:
-            print(f"Error showing death overlay: {e}")
+        print(f"Error showing death overlay: {e}")
 
 
 def hide_death_overlay(obs_client):
@@ -184,9 +278,7 @@ def hide_death_overlay(obs_client):
         return
 
     try:
-        scene = obs_client.get_current_program_scene().scene_name
-        item_id = obs_client.get_scene_item_id(scene, "mcp-death-overlay").scene_item_id
-        obs_client.set_scene_item_enabled(scene, item_id, False)
+        set_overlay_enabled(obs_client, "mcp-death-overlay", False)
         death_overlay_visible = False
         print("Death overlay hidden - back to life!")
     except Exception as e:
@@ -195,37 +287,101 @@ def hide_death_overlay(obs_client):
 
 def check_death_overlay_timeout(obs_client):
     """Check if death overlay should be hidden after timeout."""
-    global death_overlay_visible, death_overlay_time
-    import time
-
-    if death_overlay_visible and time.time() - death_overlay_time > DEATH_OVERLAY_DURATION:
+    if death_overlay_visible and time.monotonic() - death_overlay_time > DEATH_OVERLAY_DURATION:
         hide_death_overlay(obs_client)
 
 
+@dataclass
+class HealthState:
+    """Recent health readings, used to tell deaths from menus and pauses."""
+
+    low_health_count: int = 0  # Consecutive low readings before triggering
+    last_valid_health: float = 100  # Track last known valid health reading
+
+
+def update_health_state(state: HealthState, health_pct: float) -> bool:
+    """Fold a health reading into state. Returns True once a death is confirmed."""
+    # If health bar not visible (very low reading), skip detection
+    # This handles pause screens, menus, scene transitions
+    if health_pct < MIN_VALID_HEALTH:
+        # Only count as death if we previously had visible health that was low
+        if state.last_valid_health < 30:
+            state.low_health_count += 1
+        # Otherwise ignore - probably just menu/pause
+    elif health_pct < 50:
+        state.low_health_count = max(0, state.low_health_count - 1)  # Slowly reset
+        state.last_valid_health = health_pct
+    else:
+        state.low_health_count = 0  # Reset on good health
+        state.last_valid_health = health_pct
+
+    return state.low_health_count >= LOW_HEALTH_THRESHOLD
+
+
+def take_screenshot(obs_client):
+    """Grab a scaled-down screenshot of the blackmagic source (game capture)."""
+    return obs_client.get_source_screenshot(
+        name="blackmagic",
+        img_format=SCREENSHOT_FORMAT,
+        width=SCREENSHOT_WIDTH,  # Lower res for faster processing
+        height=SCREENSHOT_HEIGHT,
+        quality=-1,
+    )
+
+
 async def monitor_health():
     """Main monitoring loop."""
     print("Starting Trinea health monitor...")
     print(f"Health bar region: ({HEALTH_BAR_X}, {HEALTH_BAR_Y}) - {HEALTH_BAR_WIDTH}x{HEALTH_BAR_HEIGHT}")
     print("Monitoring for health below 50%...")
 
+    global scene_events
     obs_client = get_obs_client()
+    scene_events = watch_scene_changes()
+    state = HealthState()
+    next_log_at = 0.0
+    poll_interval = MIN_POLL_INTERVAL
+    stable_count = 0
+    pending = None  # In-flight screenshot future
+    skipped_frames = 0
+    next_skipped_log_at = time.monotonic() + SKIPPED_LOG_INTERVAL
 
     while True:
         try:
-            # Take screenshot of blackmagic source (game capture)
-            result = obs_client.get_source_screenshot(
-                name="blackmagic",
-                img_format="png",
-                width=320,  # Lower res for faster processing
-                height=240,
-                quality=70,
-            )
+            # Report dropped frames once a minute
+            now = time.monotonic()
+            if now >= next_skipped_log_at:
+                next_skipped_log_at = now + SKIPPED_LOG_INTERVAL
+                if skipped_frames:
+                    print(f"Skipped {skipped_frames} frames in the last minute (OBS slow to respond)", flush=True)
+                    skipped_frames = 0
+
+            # A screenshot that timed out is still running in its thread; wait
+            # for it to finish instead of queueing more requests behind it
+            if pending is not None:
+                if not pending.done():
+                    skipped_frames += 1
+                    await asyncio.sleep(MIN_POLL_INTERVAL)
+                    continue
+                # Late result is stale by now; drop it (and any error it raised)
+                if not pending.cancelled():
+                    pending.exception()
+                pending = None
 
-            # Decode base64 image
+            # Take screenshot of blackmagic source (game capture)
+            pending = asyncio.ensure_future(asyncio.to_thread(take_screenshot, obs_client))
+            try:
+                result = await asyncio.wait_for(asyncio.shield(pending), SCREENSHOT_TIMEOUT)
+            except asyncio.TimeoutError:
+                skipped_frames += 1
+                continue
+            pending = None
+
+            # Decode base64 image, skipping the "data:image/...;base64," prefix
+            # (only the first few bytes need scanning for the comma)
             data = result.image_data
-            if "," in data:
-                data = data.split(",")[1]
-            screenshot = base64.b64decode(data)
+            comma = data.find(",", 0, 64)
+            screenshot = base64.b64decode(data[comma + 1:] if comma != -1 else data)
 
             # Analyze health
             health_pct = get_health_percentage(screenshot)
@@ -233,27 +389,12 @@ async def monitor_health():
             # Check death overlay timeout first
             check_death_overlay_timeout(obs_client)
 
-            # Track consecutive low health readings
-            global low_health_count, last_valid_health
-
-            # If health bar not visible (very low reading), skip detection
-            # This handles pause screens, menus, scene transitions
-            if health_pct < MIN_VALID_HEALTH:
-                # Only count as death if we previously had visible health that was low
-                if last_valid_health < 30:
-                    low_health_count += 1
-                # Otherwise ignore - probably just menu/pause
-            elif health_pct < 50:
-                low_health_count = max(0, low_health_count - 1)  # Slowly reset
-                last_valid_health = health_pct
-            else:
-                low_health_count = 0  # Reset on good health
-                last_valid_health = health_pct
+            death_confirmed = update_health_state(state, health_pct)
 
             # Check thresholds with hysteresis
-            if low_health_count >= LOW_HEALTH_THRESHOLD:  # Death confirmed!
+            if death_confirmed:
                 show_death_overlay(obs_client)
-                low_health_count = 0  # Reset after showing
+                state.low_health_count = 0  # Reset after showing
             elif health_pct >= MIN_VALID_HEALTH and health_pct < 50:
                 if not death_overlay_visible:  # Don't show panic during death
                     show_panic_overlay(obs_client)
@@ -261,17 +402,32 @@ async def monitor_health():
                 hide_panic_overlay(obs_client)
 
             # Debug output every 5 seconds or on state change
-            import time
-            current_time = int(time.time())
-            if current_time % 5 == 0 or panic_overlay_visible or death_overlay_visible:
+            now = time.monotonic()
+            if now >= next_log_at or panic_overlay_visible or death_overlay_visible:
+                next_log_at = now + DEBUG_LOG_INTERVAL
                 status = "☠️ DEAD" if death_overlay_visible else ("⚠️ PANIC" if panic_overlay_visible else "✓ OK")
-                print(f"Health: {health_pct:.1f}% (low_count: {low_health_count}) {status}", flush=True)
+                print(f"Health: {health_pct:.1f}% (low_count: {state.low_health_count}) {status}", flush=True)
+
+            # Double the interval while stable; drop straight back on any change
+            stable = (
+                health_pct > STABLE_HEALTH
+                and state.low_health_count == 0
+                and not panic_overlay_visible
+                and not death_overlay_visible
+            )
+            if stable:
+                stable_count += 1
+                if stable_count >= STABLE_READINGS:
+                    poll_interval = min(MAX_POLL_INTERVAL, poll_interval * 2)
+            else:
+                stable_count = 0
+                poll_interval = MIN_POLL_INTERVAL
 
         except Exception as e:
+            pending = None
             print(f"Monitor error: {e}")
 
-        # Check every 500ms
-        await asyncio.sleep(0.5)
+        await asyncio.sleep(poll_interval)
 
 
 def main():
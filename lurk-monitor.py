@@ -9,10 +9,16 @@ import json
 import os
 import sys
 from pathlib import Path
+from urllib.parse import quote
 
 import aiohttp
 import obsws_python as obs
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # OBS connection
 OBS_HOST = os.getenv("OBS_WEBSOCKET_HOST", "localhost")
 OBS_PORT = int(os.getenv("OBS_WEBSOCKET_PORT", "4455"))
@@ -21,6 +27,9 @@ OBS_PASSWORD = os.getenv("OBS_WEBSOCKET_PASSWORD", "")
 # Chat server
 CHAT_SERVER = "http://localhost:8765"
 
+# Lurk overlay page, with the (URL-quoted) username filled in per !lurk
+LURK_URL_TEMPLATE = f"file://{Path(__file__).parent / 'assets' / 'lurk-animation.html'}?user={{user}}"
+
 # State
 obs_client = None
 lurk_hide_task = None
@@ -42,8 +51,7 @@ async def show_lurk_animation(username: str, duration: int = 10):
     scene = client.get_current_program_scene().scene_name
 
     # Build URL with username
-    html_path = Path(__file__).parent / "assets" / "lurk-animation.html"
-    url = f"file://{html_path}?user={username}"
+    url = LURK_URL_TEMPLATE.format(user=quote(username))
 
     # Track who is lurking
     current_lurker = username.lower()
@@ -118,39 +126,43 @@ async def watch_chat():
     """Watch chat server SSE for !lurk commands."""
     print("Connecting to chat server SSE...")
 
-    while True:
-        try:
-            async with aiohttp.ClientSession() as session:
+    # One session for the life of the monitor, so reconnects reuse its
+    # connection pool instead of building a new one each retry
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
                 async with session.get(f"{CHAT_SERVER}/events") as response:
                     print("Connected to chat SSE!")
 
+                    # Lines stay bytes: blank separators and keepalive
+                    # comments are skipped without decoding
                     async for line in response.content:
-                        line = line.decode("utf-8").strip()
-                        if line.startswith("data:"):
+                        if line.startswith(b"data:"):
                             try:
-                                data = json.loads(line[5:].strip())
-                                message = data.get("message", "").lower().strip()
+                                data = json_loads(line[5:])
+                                message = data.get("message", "").strip()
                                 username = data.get("username", "Someone")
 
-                                if message == "!lurk" or message.startswith("!lurk "):
+                                # "!lurk" or "!lurk ...", lowercasing only the command prefix
+                                if message[:5].lower() == "!lurk" and message[5:6] in ("", " "):
                                     print(f"🥷 {username} is lurking!")
                                     await show_lurk_animation(username, 10)
                                 else:
                                     # Check if a lurker came back
                                     await hide_lurk_for_user(username)
 
-                            except json.JSONDecodeError:
+                            except ValueError:  # Bad JSON or invalid UTF-8
                                 pass
 
-        except aiohttp.ClientError as e:
-            print(f"Chat connection error: {e}")
-            await asyncio.sleep(5)
-        except asyncio.CancelledError:
-            print("Lurk monitor cancelled")
-            raise
-        except Exception as e:
-            print(f"Error: {e}")
-            await asyncio.sleep(5)
+            except aiohttp.ClientError as e:
+                print(f"Chat connection error: {e}")
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                print("Lurk monitor cancelled")
+                raise
+            except Exception as e:
+                print(f"Error: {e}")
+                await asyncio.sleep(5)
 
 
 async def main():
@@ -5,6 +5,8 @@ Shared application state and client factories.
 import asyncio
 import json
 import os
+import threading
+import time
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
@@ -13,9 +15,9 @@ from .utils.logger import get_logger
 from .utils.obs_client import OBSClient
 from .utils.twitch_client import TwitchClient
 from .utils.chat_listener import ChatListener
-from .utils.twitch_auth import get_valid_token, TokenExpiredError
+from .utils.twitch_auth import get_valid_token, invalidate_validation_cache, TokenExpiredError
 from .utils.chat_filter import get_chat_filter
-from .utils.sse_server import start_sse_server, broadcast_message_sync, get_sse_server
+from .utils.sse_server import start_sse_server, broadcast_message_sync
 from .utils.spam_filter import enable_spam_filter
 
 logger = get_logger("app")
@@ -58,13 +60,72 @@ def _validate_env() -> list[str]:
 _obs_client: OBSClient | None = None
 _twitch_client: TwitchClient | None = None
 _chat_listener: ChatListener | None = None
+# Guards singleton creation; tools and the startup thread may race on first use
+_client_lock = threading.Lock()
 
 # Token file path
 TOKEN_FILE = Path(__file__).parent.parent / ".twitch_token.json"
 
+# Last discovered OAuth token, reused for a short while so repeated callers
+# don't each re-validate over the network or re-read the token file. The
+# entry is also dropped when the token file changes (e.g. auth.py re-run) or
+# the token gets close to its recorded expiry.
+OAUTH_TOKEN_CACHE_TTL = 300  # seconds
+OAUTH_TOKEN_EXPIRY_MARGIN = 60  # seconds
+_token_cache: dict = {"value": "", "expires_at": 0.0, "mtime_ns": None}
+
+
+def _token_file_mtime_ns() -> int | None:
+    """Modification time of TOKEN_FILE, or None if it doesn't exist."""
+    try:
+        return TOKEN_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _token_file_expiry() -> float | None:
+    """Wall-clock expiry recorded in TOKEN_FILE, if any."""
+    try:
+        with open(TOKEN_FILE) as f:
+            return float(json.load(f)["expires_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _invalidate_oauth_token_cache() -> None:
+    """Force the next _get_oauth_token() call to re-discover the token."""
+    _token_cache["expires_at"] = 0.0
+
 
 def _get_oauth_token() -> str:
-    """Get OAuth token, auto-refreshing if expired."""
+    """Get OAuth token, auto-refreshing if expired.
+
+    Successful lookups are cached for up to OAUTH_TOKEN_CACHE_TTL seconds,
+    keyed on the token file's mtime.
+    """
+    mtime_ns = _token_file_mtime_ns()
+    if (
+        _token_cache["value"]
+        and time.monotonic() < _token_cache["expires_at"]
+        and _token_cache["mtime_ns"] == mtime_ns
+    ):
+        return _token_cache["value"]
+
+    token = _discover_oauth_token()
+    if token:
+        ttl = OAUTH_TOKEN_CACHE_TTL
+        expiry = _token_file_expiry()
+        if expiry is not None:
+            ttl = min(ttl, expiry - time.time() - OAUTH_TOKEN_EXPIRY_MARGIN)
+        _token_cache["value"] = token
+        _token_cache["expires_at"] = time.monotonic() + ttl
+        # Discovery may have refreshed the token and rewritten the file
+        _token_cache["mtime_ns"] = _token_file_mtime_ns()
+    return token
+
+
+def _discover_oauth_token() -> str:
+    """Find a usable OAuth token: auto-refresh, token file, then env var."""
     client_id = os.getenv("TWITCH_CLIENT_ID", "")
     client_secret = os.getenv("TWITCH_CLIENT_SECRET", "")
 
@@ -98,8 +159,8 @@ def _get_oauth_token() -> str:
                 token = data.get("access_token", "")
                 if token:
                     # Validate it before using
-                    from .utils.twitch_auth import validate_token
-                    if validate_token(token):
+                    from .utils.twitch_auth import validate_token_cached
+                    if validate_token_cached(token):
                         logger.info("Using validated token from file")
                         return token
                     else:
@@ -121,11 +182,13 @@ def get_obs_client() -> OBSClient:
     """Get or create OBS client singleton."""
     global _obs_client
     if _obs_client is None:
-        _obs_client = OBSClient(
-            host=os.getenv("OBS_WEBSOCKET_HOST", "localhost"),
-            port=int(os.getenv("OBS_WEBSOCKET_PORT", "4455")),
-            password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""),
-        )
+        with _client_lock:
+            if _obs_client is None:
+                _obs_client = OBSClient(
+                    host=os.getenv("OBS_WEBSOCKET_HOST", "localhost"),
+                    port=int(os.getenv("OBS_WEBSOCKET_PORT", "4455")),
+                    password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""),
+                )
     return _obs_client
 
 
@@ -147,12 +210,14 @@ def get_twitch_client() -> TwitchClient:
     """Get or create Twitch client singleton."""
     global _twitch_client
     if _twitch_client is None:
-        _twitch_client = TwitchClient(
-            client_id=os.getenv("TWITCH_CLIENT_ID", ""),
-            client_secret=os.getenv("TWITCH_CLIENT_SECRET", ""),
-            oauth_token=_get_oauth_token(),
-            channel=os.getenv("TWITCH_CHANNEL", ""),
-        )
+        with _client_lock:
+            if _twitch_client is None:
+                _twitch_client = TwitchClient(
+                    client_id=os.getenv("TWITCH_CLIENT_ID", ""),
+                    client_secret=os.getenv("TWITCH_CLIENT_SECRET", ""),
+                    oauth_token=_get_oauth_token(),
+                    channel=os.getenv("TWITCH_CHANNEL", ""),
+                )
     return _twitch_client
 
 
@@ -166,6 +231,9 @@ def refresh_twitch_client(token: str = "") -> TwitchClient:
     """
     global _twitch_client, _chat_listener
 
+    _invalidate_oauth_token_cache()
+    invalidate_validation_cache()
+
     # Stop existing listener
     if _chat_listener and _chat_listener.is_running:
         _chat_listener.stop()
@@ -199,6 +267,7 @@ def get_chat_listener() -> ChatListener | None:
 def _create_sse_handler():
     """Create a handler that forwards filtered messages to SSE clients."""
     chat_filter = get_chat_filter()
+    broadcaster = os.getenv("TWITCH_CHANNEL", "").lower()
 
     def handler(msg):
         """Forward chat message to SSE server if it passes filters."""
@@ -209,7 +278,7 @@ def _create_sse_handler():
             "message": msg.message,
             "is_mod": msg.is_mod,
             "is_subscriber": msg.is_subscriber,
-            "is_broadcaster": msg.username.lower() == os.getenv("TWITCH_CHANNEL", "").lower(),
+            "is_broadcaster": msg.username.lower() == broadcaster,
         }
 
         # Apply filters
@@ -264,19 +333,18 @@ def start_chat_listener(token: str = "") -> ChatListener:
     logger.info("Spam filter enabled - will auto-ban accounts posting spam")
 
     # Auto-dispatch chat commands (including !ask for AI chat)
-    import threading
-
     def command_handler(msg):
         """Auto-handle !commands from chat. Runs slow commands in a thread."""
         if not msg.message.startswith("!"):
             return
         try:
-            from .tools.commands import _commands, _check_cooldown
-            parts = msg.message[1:].split(maxsplit=1)
-            command_name = parts[0].lower()
-            args = parts[1] if len(parts) > 1 else ""
+            from .tools.commands import get_command, _check_cooldown, parse_command
+            parsed = parse_command(msg.message)
+            if not parsed:
+                return
+            command_name, args = parsed
 
-            command = _commands.get(command_name)
+            command = get_command(command_name)
             if not command or not command.enabled:
                 return
 
@@ -304,7 +372,13 @@ def start_chat_listener(token: str = "") -> ChatListener:
     # Wire up token refresh callback: when TwitchClient refreshes its token,
     # the ChatListener automatically reconnects with the new token
     twitch = get_twitch_client()
-    twitch._on_token_refresh = _chat_listener.reconnect_with_token
+    listener = _chat_listener
+
+    def on_token_refresh(new_token: str) -> None:
+        _invalidate_oauth_token_cache()
+        listener.reconnect_with_token(new_token)
+
+    twitch._on_token_refresh = on_token_refresh
 
     _chat_listener.start()
     return _chat_listener
@@ -318,9 +392,49 @@ def stop_chat_listener() -> None:
         _chat_listener = None
 
 
-# Auto-start chat listener and SSE server when module loads
+# Background token refresh: renew this long before expiry, checking this often
+TOKEN_REFRESH_MARGIN = 300  # seconds
+TOKEN_REFRESH_CHECK_INTERVAL = 60  # seconds
+_token_refresher: threading.Thread | None = None
+
+
+def _token_refresh_worker() -> None:
+    """Refresh the Twitch token ahead of expiry so tool calls rarely have to."""
+    while True:
+        time.sleep(TOKEN_REFRESH_CHECK_INTERVAL)
+        client = _twitch_client
+        if client is None or not client.client_secret:
+            continue
+        try:
+            if client.refresh_if_expiring(TOKEN_REFRESH_MARGIN):
+                logger.info("Twitch token refreshed in background")
+        except Exception as e:
+            logger.warning(f"Background token refresh failed: {e}")
+
+
+def start_token_refresher() -> None:
+    """Start the background token refresh thread (once)."""
+    global _token_refresher
+    if _token_refresher is not None:
+        return
+    _token_refresher = threading.Thread(target=_token_refresh_worker, daemon=True, name="token-refresher")
+    _token_refresher.start()
+
+
+# Chat listener and SSE server are started by server.main(), not on import
+_startup_thread: threading.Thread | None = None
+
+
 def _auto_start_services():
-    """Try to auto-start the chat listener and SSE server in background thread."""
+    """Try to auto-start the chat listener and SSE server in background thread.
+
+    Idempotent: only the first call starts the worker. A forked child
+    inherits the started state, so it doesn't start a second copy.
+    """
+    global _startup_thread
+    if _startup_thread is not None:
+        return
+
     def _startup_worker():
         """Worker thread that handles potentially slow startup operations."""
         # Validate env vars first
@@ -331,33 +445,47 @@ def _auto_start_services():
             return
 
         # Start SSE server for chat overlay
+        loop = None
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             loop.run_until_complete(start_sse_server())
-            # Keep the loop running in a thread for SSE
-            def run_loop():
-                loop.run_forever()
-            sse_thread = threading.Thread(target=run_loop, daemon=True)
-            sse_thread.start()
             logger.info("SSE server auto-started successfully")
         except Exception as e:
             logger.warning(f"Could not auto-start SSE server: {e}")
+            loop = None
 
-        # Start chat listener (may block on IRC connection with 8s timeout)
+        # Start chat listener (connects to IRC in its own thread)
         try:
             start_chat_listener()
             logger.info("Chat listener auto-started successfully")
         except Exception as e:
             logger.error(f"Could not auto-start chat listener: {e}")
 
+        start_token_refresher()
+
+        # Startup is done; this thread now runs the SSE loop for good
+        if loop is not None:
+            loop.run_forever()
+
     # Run all startup in a background daemon thread
     # This ensures MCP tools are never blocked by startup
-    import threading
-    startup_thread = threading.Thread(target=_startup_worker, daemon=True, name="mcp-auto-start")
-    startup_thread.start()
+    _startup_thread = threading.Thread(target=_startup_worker, daemon=True, name="mcp-auto-start")
+    _startup_thread.start()
     logger.debug("Auto-start services initiated in background thread")
 
 
-# Start auto-start immediately (no delay needed since it's non-blocking now)
-_auto_start_services()
+# Lazily-resolved singletons: `app.obs_client` etc. build the client on first
+# access instead of at import time (PEP 562)
+_LAZY_SINGLETONS = {
+    "obs_client": get_obs_client,
+    "twitch_client": get_twitch_client,
+    "chat_listener": get_chat_listener,
+}
+
+
+def __getattr__(name: str):
+    factory = _LAZY_SINGLETONS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
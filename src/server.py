@@ -5,14 +5,16 @@ A unified MCP server for OBS Studio control, Twitch integration,
 and real-time game translation.
 """
 
-from .app import mcp
-
-# Import tools to register them with the mcp instance
-from .tools import obs, chat, moderation, twitch, translation, alerts, shoutout, clips, uploads  # noqa: F401
+from .app import mcp, _auto_start_services
+from .tools import register_all
 
 
 def main():
     """Run the MCP server."""
+    # Import the tool modules so they register with the mcp instance
+    register_all()
+    # Chat listener and SSE server start in the background, not on import
+    _auto_start_services()
     mcp.run(transport="stdio")
 
 
@@ -1,25 +1,12 @@
 """
 MCP tools for OBS and Twitch control.
+
+Tool modules register themselves with the mcp instance when imported. They
+are loaded on first attribute access (PEP 562); call register_all() before
+serving so every tool is listed.
 """
 
-from . import obs
-from . import chat
-from . import moderation
-from . import twitch
-from . import translation
-from . import alerts
-from . import shoutout
-from . import lurk
-from . import clips
-from . import uploads
-from . import vod
-from . import commands
-from . import health
-from . import autoclip
-from . import scheduler
-from . import engagement
-from . import chat_overlay
-from . import obs_process
+import importlib
 
 __all__ = [
     "obs",
@@ -41,3 +28,18 @@ __all__ = [
     "chat_overlay",
     "obs_process",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def register_all() -> None:
+    """Import every tool module so its tools are registered."""
+    for name in __all__:
+        if name not in globals():
+            __getattr__(name)
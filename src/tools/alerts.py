@@ -3,9 +3,72 @@ Stream alert tools.
 """
 
 import asyncio
+import time
 
 from ..app import mcp, get_obs_client
 
+# Text colors (ARGB) for show_custom_alert
+ALERT_COLORS = {
+    "white": 0xFFFFFFFF,
+    "red": 0xFFFF0000,
+    "green": 0xFF00FF00,
+    "blue": 0xFF0000FF,
+    "yellow": 0xFFFFFF00,
+}
+
+# Alert centre points on a 1920x1080 canvas
+ALERT_POSITIONS = {
+    "center": (960, 540),
+    "top": (960, 200),
+    "bottom": (960, 800),
+}
+
+# Every alert source clear_all_alerts knows how to remove
+ALERT_SOURCES = ("follow-alert", "custom-alert", "raid-alert", "sub-alert")
+
+# Program scene, reused briefly so a burst of alerts costs one OBS lookup
+SCENE_CACHE_TTL = 1.0  # seconds
+_scene_cache: dict = {"value": "", "expires_at": 0.0}
+
+# Pending alert removals by source name; re-showing an alert replaces its timer
+_pending_removals: dict[str, asyncio.TimerHandle] = {}
+
+
+def _current_scene(client) -> str:
+    """Current program scene, cached for SCENE_CACHE_TTL seconds."""
+    now = time.monotonic()
+    if _scene_cache["value"] and now < _scene_cache["expires_at"]:
+        return _scene_cache["value"]
+    scene = client.get_current_scene()
+    _scene_cache["value"] = scene
+    _scene_cache["expires_at"] = now + SCENE_CACHE_TTL
+    return scene
+
+
+def _remove_alert(name: str) -> None:
+    """Remove an alert source, ignoring errors if it's already gone."""
+    _pending_removals.pop(name, None)
+    try:
+        get_obs_client().remove_source(name)
+    except Exception:
+        pass
+
+
+def _schedule_removal(name: str, delay: float) -> None:
+    """Remove the named alert after delay seconds, replacing any earlier timer."""
+    handle = _pending_removals.pop(name, None)
+    if handle:
+        handle.cancel()
+    loop = asyncio.get_running_loop()
+    _pending_removals[name] = loop.call_later(delay, _remove_alert, name)
+
+
+def _cancel_removals() -> None:
+    """Cancel every pending alert removal."""
+    for handle in _pending_removals.values():
+        handle.cancel()
+    _pending_removals.clear()
+
 
 @mcp.tool()
 def show_follow_alert(
@@ -22,7 +85,7 @@ def show_follow_alert(
         duration_seconds: How long to show the alert
     """
     client = get_obs_client()
-    scene = client.get_current_scene()
+    scene = _current_scene(client)
 
     alert_text = f"🎉 {username} 🎉\n{message}"
 
@@ -45,14 +108,7 @@ def show_follow_alert(
     client.set_scene_item_transform(scene, item_id, 960, 400, alignment=4)
 
     # Schedule removal
-    async def remove_after_delay():
-        await asyncio.sleep(duration_seconds)
-        try:
-            client.remove_source("follow-alert")
-        except Exception:
-            pass
-
-    asyncio.create_task(remove_after_delay())
+    _schedule_removal("follow-alert", duration_seconds)
 
     return f"Showing follow alert for {username}"
 
@@ -76,29 +132,12 @@ def show_custom_alert(
         position: Where to show (center, top, bottom)
     """
     client = get_obs_client()
-    scene = client.get_current_scene()
+    scene = _current_scene(client)
 
-    alert_text = title
-    if subtitle:
-        alert_text = f"{title}\n{subtitle}"
-
-    # Color mapping
-    colors = {
-        "white": 0xFFFFFFFF,
-        "red": 0xFFFF0000,
-        "green": 0xFF00FF00,
-        "blue": 0xFF0000FF,
-        "yellow": 0xFFFFFF00,
-    }
-    color_int = colors.get(color.lower(), 0xFFFFFFFF)
-
-    # Position mapping
-    positions = {
-        "center": (960, 540),
-        "top": (960, 200),
-        "bottom": (960, 800),
-    }
-    x, y = positions.get(position, (960, 540))
+    alert_text = f"{title}\n{subtitle}" if subtitle else title
+
+    color_int = ALERT_COLORS.get(color.lower(), 0xFFFFFFFF)
+    x, y = ALERT_POSITIONS.get(position, (960, 540))
 
     # Remove old alert if present
     try:
@@ -118,14 +157,7 @@ def show_custom_alert(
     client.set_scene_item_transform(scene, item_id, x, y, alignment=4)
 
     # Schedule removal
-    async def remove_after_delay():
-        await asyncio.sleep(duration_seconds)
-        try:
-            client.remove_source("custom-alert")
-        except Exception:
-            pass
-
-    asyncio.create_task(remove_after_delay())
+    _schedule_removal("custom-alert", duration_seconds)
 
     return f"Showing custom alert: {title}"
 
@@ -134,11 +166,12 @@ def show_custom_alert(
 def clear_all_alerts() -> str:
     """Remove all alert overlays from the scene."""
     client = get_obs_client()
+    _cancel_removals()
+    _scene_cache["expires_at"] = 0.0
 
-    alerts = ["follow-alert", "custom-alert", "raid-alert", "sub-alert"]
     removed = []
 
-    for alert in alerts:
+    for alert in ALERT_SOURCES:
         try:
             client.remove_source(alert)
             removed.append(alert)
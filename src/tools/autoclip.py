@@ -15,97 +15,181 @@ import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable
+from typing import Callable, Iterable
 
 from ..app import mcp, get_twitch_client
 from ..utils.logger import get_logger
 from ..utils.twitch_client import ChatMessage
+from .clips import obs_clip
 
 logger = get_logger("autoclip")
 
-# Hype detection settings
+# Hype detection settings (threshold and cooldown are defaults; the tools
+# below change the detector's own copies)
 WINDOW_SECONDS = 10  # Sliding window for message rate
 SPIKE_THRESHOLD = 5  # Messages per second to trigger (normally ~1-2 msg/sec)
 COOLDOWN_SECONDS = 60  # Minimum time between auto-clips
-HYPE_KEYWORDS = [
+EVALUATE_INTERVAL = 0.1  # Seconds between hype checks on the monitor thread
+HYPE_KEYWORDS: set[str] = {
     "pog", "pogchamp", "pogu", "clip", "clip it", "omg", "holy",
     "wtf", "lol", "lmao", "gg", "ez", "w", "dub", "let's go",
     "no way", "insane", "crazy", "nani", "bruh",
-]
-HYPE_EMOTES = [
+}
+HYPE_EMOTES: frozenset[str] = frozenset({
     "PogChamp", "KEKW", "LUL", "OMEGALUL", "PepeHands", "Pog",
     "POGGERS", "monkaS", "monkaW", "PauseChamp", "Kreygasm",
-]
+})
+
+
+def _compile_any(needles: Iterable[str], flags: int = 0) -> re.Pattern:
+    """Compile a regex matching any of the given substrings."""
+    return re.compile("|".join(map(re.escape, needles)), flags)
+
+
+# One C-level scan per message instead of a Python loop over each needle.
+# Keywords are case-insensitive; emotes are matched exactly.
+_keyword_re = _compile_any(HYPE_KEYWORDS, re.IGNORECASE)
+_emote_re = _compile_any(HYPE_EMOTES)
 
 
 @dataclass
 class HypeDetector:
     """Detects hype moments in chat."""
 
-    message_times: deque = field(default_factory=lambda: deque(maxlen=1000))
-    last_clip_time: float = 0
+    # Timestamps inside the sliding window, oldest first; recent_count tracks
+    # len() so the message rate never needs a scan
+    message_times: deque = field(default_factory=deque)
+    recent_count: int = 0
+    last_clip_time: float = 0  # Wall clock, for reporting only
+    last_clip_monotonic: float = float("-inf")  # For cooldown math
     enabled: bool = False
+    spike_threshold: float = SPIKE_THRESHOLD
+    # Rate needed alongside a keyword/emote; kept in step by set_spike_threshold()
+    half_threshold: float = SPIKE_THRESHOLD * 0.5
+    cooldown_seconds: float = COOLDOWN_SECONDS
     clip_callback: Callable[[], None] | None = None
     _monitor_thread: threading.Thread | None = None
     _running: bool = False
+    _last_clip_iso: tuple[float, str] | None = None  # (last_clip_time, formatted)
+    # Set by on_message, consumed by the next _evaluate()
+    _keyword_seen: bool = False
+    _emote_seen: bool = False
+    # on_message runs on the chat listener thread, the tools on the MCP thread
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def _prune(self, now: float) -> None:
+        """Drop timestamps that have left the sliding window."""
+        cutoff = now - WINDOW_SECONDS
+        times = self.message_times
+        while times and times[0] <= cutoff:
+            times.popleft()
+            self.recent_count -= 1
 
     def on_message(self, msg: ChatMessage) -> None:
-        """Process an incoming chat message."""
+        """Record an incoming chat message; the monitor thread judges hype."""
         if not self.enabled:
             return
 
-        now = time.time()
-        self.message_times.append(now)
-
         # Check for hype keywords/emotes
-        text_lower = msg.message.lower()
-        keyword_match = any(kw in text_lower for kw in HYPE_KEYWORDS)
-        emote_match = any(emote in msg.message for emote in HYPE_EMOTES)
+        keyword_match = _keyword_re.search(msg.message) is not None
+        emote_match = _emote_re.search(msg.message) is not None
+
+        with self._lock:
+            self.message_times.append(time.monotonic())
+            self.recent_count += 1
+            if keyword_match:
+                self._keyword_seen = True
+            if emote_match:
+                self._emote_seen = True
+
+    def _evaluate(self) -> None:
+        """Prune the window and clip if chat is currently hype."""
+        with self._lock:
+            now = time.monotonic()
+
+            # Calculate recent message rate
+            self._prune(now)
+            msg_rate = self.recent_count / WINDOW_SECONDS
+
+            keyword_match, self._keyword_seen = self._keyword_seen, False
+            emote_match, self._emote_seen = self._emote_seen, False
+
+            # Check if this is a hype moment
+            is_hype = False
+            reason = ""
+
+            if msg_rate >= self.spike_threshold:
+                is_hype = True
+                reason = f"Chat spike: {msg_rate:.1f} msg/sec"
+            elif keyword_match and msg_rate >= self.half_threshold:
+                is_hype = True
+                reason = f"Keyword + activity: {msg_rate:.1f} msg/sec"
+            elif emote_match and msg_rate >= self.half_threshold:
+                is_hype = True
+                reason = f"Emote spam + activity: {msg_rate:.1f} msg/sec"
+
+            # Claim the clip if hype detected and not on cooldown
+            if not is_hype or (now - self.last_clip_monotonic) < self.cooldown_seconds:
+                return
+            self.last_clip_monotonic = now
+            self.last_clip_time = time.time()
+
+        # Clip outside the lock; it talks to OBS and can be slow
+        logger.info("Hype detected! %s", reason)
+        if self.clip_callback:
+            try:
+                self.clip_callback()
+            except Exception as e:
+                logger.error("Auto-clip callback failed: %s", e)
+
+    def _monitor(self) -> None:
+        """Evaluate hype at a fixed rate, independent of chat speed."""
+        while self._running:
+            self._evaluate()
+            time.sleep(EVALUATE_INTERVAL)
+
+    def start_monitor(self) -> None:
+        """Start the evaluation thread (reusing it if still winding down)."""
+        self._running = True
+        if self._monitor_thread and self._monitor_thread.is_alive():
+            return
+        self._monitor_thread = threading.Thread(target=self._monitor, daemon=True, name="autoclip-monitor")
+        self._monitor_thread.start()
 
-        # Calculate recent message rate
-        cutoff = now - WINDOW_SECONDS
-        recent = sum(1 for t in self.message_times if t > cutoff)
-        msg_rate = recent / WINDOW_SECONDS
-
-        # Check if this is a hype moment
-        is_hype = False
-        reason = ""
-
-        if msg_rate >= SPIKE_THRESHOLD:
-            is_hype = True
-            reason = f"Chat spike: {msg_rate:.1f} msg/sec"
-        elif keyword_match and msg_rate >= SPIKE_THRESHOLD * 0.5:
-            is_hype = True
-            reason = f"Keyword + activity: {msg_rate:.1f} msg/sec"
-        elif emote_match and msg_rate >= SPIKE_THRESHOLD * 0.5:
-            is_hype = True
-            reason = f"Emote spam + activity: {msg_rate:.1f} msg/sec"
-
-        # Trigger clip if hype detected and not on cooldown
-        if is_hype and (now - self.last_clip_time) >= COOLDOWN_SECONDS:
-            logger.info(f"Hype detected! {reason}")
-            self.last_clip_time = now
-            if self.clip_callback:
-                try:
-                    self.clip_callback()
-                except Exception as e:
-                    logger.error(f"Auto-clip callback failed: {e}")
+    def set_spike_threshold(self, messages_per_second: float) -> None:
+        """Change the spike threshold. Caller holds the lock."""
+        self.spike_threshold = messages_per_second
+        self.half_threshold = messages_per_second * 0.5
+
+    def stop_monitor(self) -> None:
+        """Ask the evaluation thread to exit after its current tick."""
+        self._running = False
 
     def get_stats(self) -> dict:
         """Get current detection stats."""
-        now = time.time()
-        cutoff = now - WINDOW_SECONDS
-        recent = sum(1 for t in self.message_times if t > cutoff)
-        msg_rate = recent / WINDOW_SECONDS
-
-        return {
-            "enabled": self.enabled,
-            "current_msg_rate": round(msg_rate, 2),
-            "spike_threshold": SPIKE_THRESHOLD,
-            "window_seconds": WINDOW_SECONDS,
-            "cooldown_remaining": max(0, COOLDOWN_SECONDS - (now - self.last_clip_time)),
-            "last_clip_time": datetime.fromtimestamp(self.last_clip_time).isoformat() if self.last_clip_time else None,
-        }
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            msg_rate = self.recent_count / WINDOW_SECONDS
+
+            return {
+                "enabled": self.enabled,
+                "current_msg_rate": round(msg_rate, 2),
+                "spike_threshold": self.spike_threshold,
+                "window_seconds": WINDOW_SECONDS,
+                "cooldown_remaining": max(0, self.cooldown_seconds - (now - self.last_clip_monotonic)),
+                "last_clip_time": self._format_last_clip_time(),
+            }
+
+    def _format_last_clip_time(self) -> str | None:
+        """ISO timestamp of the last clip, formatted once per clip."""
+        if not self.last_clip_time:
+            return None
+        cached = self._last_clip_iso
+        if cached is None or cached[0] != self.last_clip_time:
+            cached = (self.last_clip_time, datetime.fromtimestamp(self.last_clip_time).isoformat())
+            self._last_clip_iso = cached
+        return cached[1]
 
 
 # Global detector instance
@@ -114,10 +198,9 @@ _detector = HypeDetector()
 
 def _create_clip():
     """Callback to create a clip when hype is detected."""
-    from .clips import obs_clip
     result = obs_clip()
     if result.get("status") == "clipped":
-        logger.info(f"Auto-clip saved: {result.get('file_path')}")
+        logger.info("Auto-clip saved: %s", result.get("file_path"))
         # Optionally announce in chat
         try:
             twitch = get_twitch_client()
@@ -125,7 +208,7 @@ def _create_clip():
         except Exception:
             pass
     else:
-        logger.warning(f"Auto-clip failed: {result}")
+        logger.warning("Auto-clip failed: %s", result)
 
 
 def _message_handler(msg: ChatMessage) -> None:
@@ -148,11 +231,12 @@ def enable_autoclip() -> dict:
     Returns:
         Status dict.
     """
-    if _detector.enabled:
-        return {"status": "already_enabled"}
-
-    _detector.enabled = True
-    _detector.clip_callback = _create_clip
+    with _detector._lock:
+        if _detector.enabled:
+            return {"status": "already_enabled"}
+        _detector.clip_callback = _create_clip
+        _detector.enabled = True
+    _detector.start_monitor()
 
     # Register as chat message handler
     try:
@@ -162,14 +246,15 @@ def enable_autoclip() -> dict:
         return {
             "status": "enabled",
             "settings": {
-                "spike_threshold": f"{SPIKE_THRESHOLD} msg/sec",
+                "spike_threshold": f"{_detector.spike_threshold} msg/sec",
                 "window": f"{WINDOW_SECONDS} seconds",
-                "cooldown": f"{COOLDOWN_SECONDS} seconds",
+                "cooldown": f"{_detector.cooldown_seconds} seconds",
             },
         }
     except Exception as e:
         _detector.enabled = False
-        logger.error(f"Failed to enable auto-clip: {e}")
+        _detector.stop_monitor()
+        logger.error("Failed to enable auto-clip: %s", e)
         return {"status": "error", "message": str(e)}
 
 
@@ -181,7 +266,16 @@ def disable_autoclip() -> dict:
     Returns:
         Status dict.
     """
-    _detector.enabled = False
+    with _detector._lock:
+        _detector.enabled = False
+    _detector.stop_monitor()
+
+    # Unregister so enable/disable cycles don't stack up handlers
+    try:
+        get_twitch_client().remove_message_handler(_message_handler)
+    except Exception as e:
+        logger.warning("Could not remove auto-clip chat handler: %s", e)
+
     logger.info("Auto-clip disabled")
     return {"status": "disabled"}
 
@@ -210,8 +304,8 @@ def set_autoclip_threshold(messages_per_second: float) -> dict:
     Returns:
         Status dict.
     """
-    global SPIKE_THRESHOLD
-    SPIKE_THRESHOLD = messages_per_second
+    with _detector._lock:
+        _detector.set_spike_threshold(messages_per_second)
     return {
         "status": "updated",
         "new_threshold": messages_per_second,
@@ -229,8 +323,8 @@ def set_autoclip_cooldown(seconds: int) -> dict:
     Returns:
         Status dict.
     """
-    global COOLDOWN_SECONDS
-    COOLDOWN_SECONDS = seconds
+    with _detector._lock:
+        _detector.cooldown_seconds = seconds
     return {
         "status": "updated",
         "new_cooldown": seconds,
@@ -248,11 +342,13 @@ def add_hype_keyword(keyword: str) -> dict:
     Returns:
         Status dict.
     """
+    global _keyword_re
     keyword_lower = keyword.lower()
-    if keyword_lower not in HYPE_KEYWORDS:
-        HYPE_KEYWORDS.append(keyword_lower)
-        return {"status": "added", "keyword": keyword_lower}
-    return {"status": "already_exists", "keyword": keyword_lower}
+    if keyword_lower in HYPE_KEYWORDS:
+        return {"status": "already_exists", "keyword": keyword_lower}
+    HYPE_KEYWORDS.add(keyword_lower)
+    _keyword_re = _compile_any(HYPE_KEYWORDS, re.IGNORECASE)
+    return {"status": "added", "keyword": keyword_lower}
 
 
 @mcp.tool()
@@ -264,6 +360,6 @@ def list_hype_keywords() -> dict:
         Dict with keywords and emotes.
     """
     return {
-        "keywords": HYPE_KEYWORDS,
-        "emotes": HYPE_EMOTES,
+        "keywords": sorted(HYPE_KEYWORDS),
+        "emotes": sorted(HYPE_EMOTES),
     }
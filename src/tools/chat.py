@@ -3,46 +3,71 @@ Twitch chat interaction tools.
 """
 
 import os
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 
-from ..app import mcp, get_twitch_client, refresh_twitch_client, get_chat_listener
+from ..app import mcp, get_twitch_client, refresh_twitch_client, get_chat_listener, start_chat_listener, stop_chat_listener
 from ..utils import chat_logger
 from ..utils.logger import get_logger
 from ..utils.twitch_auth import save_token, load_token, get_valid_token, TokenExpiredError
 
 logger = get_logger("chat_tools")
 
+# Fields returned for each cached chat message, read in one attrgetter call
+_MESSAGE_FIELDS = ("username", "message", "is_mod", "is_subscriber")
+_get_message_fields = attrgetter(*_MESSAGE_FIELDS)
+
+# twitch_reconnect leaves a working connection alone if the token has this long left
+RECONNECT_SKIP_MIN_EXPIRY = 600  # seconds
+
+# App credentials, fixed for the life of the process (set via setenv.sh)
+_TWITCH_CLIENT_ID = os.getenv("TWITCH_CLIENT_ID", "")
+_TWITCH_CLIENT_SECRET = os.getenv("TWITCH_CLIENT_SECRET", "")
+
+# How long a send waits for a (re)starting chat listener before just queueing
+LISTENER_CONNECT_TIMEOUT = 1.0  # seconds
+
+
+def _extract_access_token(token_data: dict | None) -> str:
+    """Access token from loaded token data, or "" if there isn't one."""
+    return (token_data or {}).get("access_token") or ""
+
+
+def _send_to_chat(text: str) -> bool:
+    """Queue text on the chat listener, restarting it if it has stopped.
+
+    Returns False if the listener is still connecting; the message is
+    queued and goes out once it connects. Raises RuntimeError if the
+    listener could not connect, so nothing would ever be sent.
+    """
+    listener = get_chat_listener()
+    if not (listener and listener.is_listening):
+        logger.info("Chat listener not running, restarting it")
+        if listener:
+            stop_chat_listener()
+        listener = start_chat_listener()
+    connected = listener.wait_connected(LISTENER_CONNECT_TIMEOUT)
+    if not connected and not listener.is_listening:
+        raise RuntimeError("Chat listener could not connect to Twitch IRC - message not sent")
+    listener.send_message(text)
+    return connected
 
 
 @mcp.tool()
 def twitch_send_message(message: str) -> str:
     """Send a message to Twitch chat."""
-    # Use the persistent chat listener connection (non-blocking)
-    listener = get_chat_listener()
-    if listener and listener.is_running:
-        listener.send_message(message)
+    if _send_to_chat(message):
         return f"Sent to chat: {message}"
-    else:
-        # Fallback to client method (blocks for 8s, but only if listener not running)
-        client = get_twitch_client()
-        client.send_chat_message(message)
-        return f"Sent to chat (fallback): {message}"
+    return f"Queued for chat (still connecting): {message}"
 
 
 @mcp.tool()
 def twitch_reply_to_user(username: str, message: str) -> str:
     """Reply to a specific user in chat (mentions them)."""
-    full_message = f"@{username} {message}"
-    # Use the persistent chat listener connection (non-blocking)
-    listener = get_chat_listener()
-    if listener and listener.is_running:
-        listener.send_message(full_message)
+    if _send_to_chat(f"@{username} {message}"):
         return f"Replied to @{username}: {message}"
-    else:
-        # Fallback to client method (blocks for 8s, but only if listener not running)
-        client = get_twitch_client()
-        client.send_chat_message(full_message)
-        return f"Replied to @{username}: {message} (fallback)"
+    return f"Queued reply to @{username} (still connecting): {message}"
 
 
 @mcp.tool()
@@ -54,15 +79,7 @@ def twitch_get_recent_messages(count: int = 10) -> list[dict]:
     """
     client = get_twitch_client()
     messages = client.get_recent_messages(count)
-    return [
-        {
-            "username": m.username,
-            "message": m.message,
-            "is_mod": m.is_mod,
-            "is_subscriber": m.is_subscriber,
-        }
-        for m in messages
-    ]
+    return [dict(zip(_MESSAGE_FIELDS, _get_message_fields(m))) for m in messages]
 
 
 @mcp.tool()
@@ -109,8 +126,8 @@ def twitch_refresh_token() -> dict:
 
     Use this when API calls fail with 401 Unauthorized.
     """
-    client_id = os.getenv("TWITCH_CLIENT_ID", "")
-    client_secret = os.getenv("TWITCH_CLIENT_SECRET", "")
+    client_id = _TWITCH_CLIENT_ID
+    client_secret = _TWITCH_CLIENT_SECRET
 
     if not client_id or not client_secret:
         return {
@@ -150,11 +167,34 @@ def twitch_reconnect() -> dict:
     - Token has expired
     - IRC connection dropped
     """
-    from ..utils.twitch_auth import validate_token, load_token
+    from ..utils.twitch_auth import validate_token_cached, load_token, invalidate_validation_cache
+
+    # Something is wrong if we're here; don't trust cached validations
+    invalidate_validation_cache()
+
+    # Nothing to do if the current token is good and chat is connected;
+    # a reconnect tears down IRC for several seconds
+    saved_token = _extract_access_token(load_token())
+    validation = validate_token_cached(saved_token) if saved_token else None
+    listener = get_chat_listener()
+    if (
+        validation
+        and validation.get("expires_in", 0) > RECONNECT_SKIP_MIN_EXPIRY
+        and listener
+        and listener.is_connected
+    ):
+        return {
+            "status": "connected",
+            "channel": os.getenv("TWITCH_CHANNEL", ""),
+            "user": validation.get("login"),
+            "token_expires_in": f"{validation.get('expires_in', 0) // 3600} hours",
+            "scopes": validation.get("scopes", []),
+            "message": "Token valid and chat connected - no reconnect needed",
+        }
 
     # Get a valid token first, then pass it through
-    client_id = os.getenv("TWITCH_CLIENT_ID", "")
-    client_secret = os.getenv("TWITCH_CLIENT_SECRET", "")
+    client_id = _TWITCH_CLIENT_ID
+    client_secret = _TWITCH_CLIENT_SECRET
     token = ""
     if client_id and client_secret:
         try:
@@ -162,14 +202,14 @@ def twitch_reconnect() -> dict:
         except Exception:
             pass
     if not token:
-        token_data = load_token()
-        token = token_data.get("access_token", "") if token_data else ""
+        # Fall back to the token file as read above
+        token = saved_token
 
     # Refresh the client with the known token
     client = refresh_twitch_client(token=token)
 
     # Validate the token
-    validation = validate_token(token) if token else None
+    validation = validate_token_cached(token) if token else None
 
     if validation:
         expires_hours = validation.get("expires_in", 0) // 3600
@@ -237,8 +277,23 @@ def twitch_get_polls() -> list[dict]:
     return client.get_polls()
 
 
-_device_code_state: dict | None = None
-"""Tracks in-progress device code auth flow (non-blocking)."""
+@dataclass(slots=True, frozen=True)
+class DeviceCodeFlow:
+    """An in-progress device code auth flow, started by twitch_reauth."""
+
+    device_code: str
+    user_code: str
+    verification_uri: str
+    expires_in: int
+    scopes: tuple[str, ...]
+    started_at: float
+
+
+_device_code_state: DeviceCodeFlow | None = None
+"""Tracks in-progress device code auth flow (non-blocking).
+
+Replaced wholesale rather than mutated, so a reader never sees half an update.
+"""
 
 
 def _try_token_file_and_reconnect(client_id: str, client_secret: str) -> dict | None:
@@ -246,12 +301,12 @@ def _try_token_file_and_reconnect(client_id: str, client_secret: str) -> dict |
     Try to get a valid token from the token file (same as auth.py does).
     Returns success dict or None if it didn't work.
     """
-    from ..utils.twitch_auth import validate_token
+    from ..utils.twitch_auth import validate_token_cached
 
     try:
         new_token = get_valid_token(client_id, client_secret)
         client = refresh_twitch_client(token=new_token)
-        validation = validate_token(new_token)
+        validation = validate_token_cached(new_token)
         if validation:
             expires_hours = validation.get("expires_in", 0) // 3600
             return {
@@ -280,7 +335,7 @@ def _run_auth_py_subprocess(client_id: str, client_secret: str) -> dict | None:
     """
     import subprocess
     from pathlib import Path
-    from ..utils.twitch_auth import validate_token
+    from ..utils.twitch_auth import validate_token_cached
 
     auth_py = Path(__file__).parent.parent.parent / "auth.py"
     if not auth_py.exists():
@@ -311,7 +366,7 @@ def _run_auth_py_subprocess(client_id: str, client_secret: str) -> dict | None:
             # auth.py saved the token file — now load and reconnect
             new_token = get_valid_token(client_id, client_secret)
             client = refresh_twitch_client(token=new_token)
-            validation = validate_token(new_token)
+            validation = validate_token_cached(new_token)
             if validation:
                 expires_hours = validation.get("expires_in", 0) // 3600
                 return {
@@ -359,13 +414,14 @@ def twitch_reauth() -> dict:
     """
     global _device_code_state
     from ..utils.twitch_auth import (
-        validate_token,
+        validate_token_cached,
+        invalidate_validation_cache,
         get_device_code,
         save_token,
     )
 
-    client_id = os.getenv("TWITCH_CLIENT_ID", "")
-    client_secret = os.getenv("TWITCH_CLIENT_SECRET", "")
+    client_id = _TWITCH_CLIENT_ID
+    client_secret = _TWITCH_CLIENT_SECRET
 
     if not client_id or not client_secret:
         return {
@@ -373,6 +429,9 @@ def twitch_reauth() -> dict:
             "message": "TWITCH_CLIENT_ID and TWITCH_CLIENT_SECRET required",
         }
 
+    # Re-check the token for real; cached validations may predate the problem
+    invalidate_validation_cache()
+
     # ALWAYS try the token file first — even if there's a pending device code.
     # Another process (auth.py, another session) may have refreshed it.
     logger.info("twitch_reauth: trying token file first...")
@@ -383,33 +442,36 @@ def twitch_reauth() -> dict:
 
     # Token file didn't work — try running auth.py subprocess.
     # This is the most reliable path: same thing that works from CLI.
-    logger.info("twitch_reauth: token file failed, trying auth.py subprocess...")
-    result = _run_auth_py_subprocess(client_id, client_secret)
-    if result:
-        _device_code_state = None
-        return result
+    # auth.py can only finish unattended via a refresh_token; without one, or
+    # with our own device code already pending, it would sit in its
+    # interactive flow until the 15s timeout, so go straight to device code.
+    if _device_code_state is None and (load_token() or {}).get("refresh_token"):
+        logger.info("twitch_reauth: token file failed, trying auth.py subprocess...")
+        result = _run_auth_py_subprocess(client_id, client_secret)
+        if result:
+            return result
 
     # If there's a pending device code flow, check if user authorized
-    if _device_code_state:
+    state = _device_code_state
+    if state:
         logger.info("twitch_reauth: checking pending device code auth...")
         try:
             import time
-            state = _device_code_state
-            elapsed = time.time() - state["started_at"]
-            if elapsed > state["expires_in"]:
+            elapsed = time.time() - state.started_at
+            if elapsed > state.expires_in:
                 _device_code_state = None
                 return {
                     "status": "error",
                     "message": "Device code expired. Call twitch_reauth again to get a new code.",
                 }
 
-            import httpx
-            resp = httpx.post(
+            from ..utils.twitch_auth import http_client
+            resp = http_client.post(
                 "https://id.twitch.tv/oauth2/token",
                 data={
                     "client_id": client_id,
-                    "scopes": " ".join(state["scopes"]),
-                    "device_code": state["device_code"],
+                    "scopes": " ".join(state.scopes),
+                    "device_code": state.device_code,
                     "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
                 },
                 timeout=10.0,
@@ -421,7 +483,7 @@ def twitch_reauth() -> dict:
                 save_token(data)
                 new_token = data["access_token"]
                 client = refresh_twitch_client(token=new_token)
-                validation = validate_token(new_token)
+                validation = validate_token_cached(new_token)
                 if validation:
                     expires_hours = validation.get("expires_in", 0) // 3600
                     return {
@@ -439,11 +501,11 @@ def twitch_reauth() -> dict:
             elif data.get("message") == "authorization_pending":
                 return {
                     "status": "awaiting_auth",
-                    "message": f"Still waiting for browser authorization. Go to: {state['verification_uri']}?device-code={state['user_code']} and enter code: {state['user_code']}",
-                    "url": state["verification_uri"],
-                    "code": state["user_code"],
+                    "message": f"Still waiting for browser authorization. Go to: {state.verification_uri}?device-code={state.user_code} and enter code: {state.user_code}",
+                    "url": state.verification_uri,
+                    "code": state.user_code,
                     "elapsed_seconds": int(elapsed),
-                    "expires_in_seconds": state["expires_in"] - int(elapsed),
+                    "expires_in_seconds": state.expires_in - int(elapsed),
                 }
             else:
                 _device_code_state = None
@@ -473,14 +535,14 @@ def twitch_reauth() -> dict:
             "clips:edit",
         ]
         device_data = get_device_code(client_id, scopes)
-        _device_code_state = {
-            "device_code": device_data["device_code"],
-            "user_code": device_data["user_code"],
-            "verification_uri": device_data["verification_uri"],
-            "expires_in": device_data["expires_in"],
-            "scopes": scopes,
-            "started_at": time.time(),
-        }
+        _device_code_state = DeviceCodeFlow(
+            device_code=device_data["device_code"],
+            user_code=device_data["user_code"],
+            verification_uri=device_data["verification_uri"],
+            expires_in=device_data["expires_in"],
+            scopes=tuple(scopes),
+            started_at=time.time(),
+        )
 
         return {
             "status": "device_code_started",
@@ -505,15 +567,15 @@ def twitch_reauth_status() -> dict:
     Returns:
         Dict with token validity, user, and expiry info
     """
-    from ..utils.twitch_auth import load_token, validate_token
+    from ..utils.twitch_auth import load_token, validate_token_cached
     import time
 
     token_data = load_token()
     if not token_data:
         return {"status": "no_token", "message": "No token file found. Run twitch_reauth() or 'uv run python auth.py'."}
 
-    token = token_data.get("access_token", "")
-    validation = validate_token(token) if token else None
+    token = _extract_access_token(token_data)
+    validation = validate_token_cached(token) if token else None
 
     if validation:
         expires_in = validation.get("expires_in", 0)
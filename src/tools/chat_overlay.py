@@ -4,6 +4,7 @@ Chat overlay MCP tools.
 Provides tools for displaying live Twitch chat on stream via browser source.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlencode
 
@@ -24,14 +25,90 @@ THEMES = {
     "minimal": "minimal.html",
 }
 
+# Overlay margins by position: (left, top, right, bottom)
+OVERLAY_POSITIONS = {
+    "bottom-left": (20, None, None, 20),
+    "bottom-right": (None, None, 20, 20),
+    "left": (20, 100, None, 100),
+    "right": (None, 100, 20, 100),
+    "top-left": (20, 20, None, None),
+    "top-right": (None, 20, 20, None),
+}
+
+# Theme HTML files live here
+ASSETS_DIR = Path(__file__).parent.parent.parent / "assets" / "chat-overlay"
+
+# Descriptions shown by list_chat_themes
+THEME_INFO = {
+    "retro": {
+        "name": "Retro",
+        "description": "Neon colors with CRT scanline effect. Great for general streaming.",
+        "style": "Cyberpunk / 80s arcade",
+    },
+    "jrpg": {
+        "name": "JRPG",
+        "description": "Pixel art text boxes inspired by classic Japanese RPGs.",
+        "style": "Retro gaming / 16-bit era",
+    },
+    "minimal": {
+        "name": "Minimal",
+        "description": "Clean, transparent design that stays out of the way.",
+        "style": "Modern / Professional",
+    },
+}
+
+# list_chat_themes entries, minus the "available" flag
+_THEME_LIST = [
+    {
+        "id": theme_id,
+        "name": THEME_INFO.get(theme_id, {}).get("name", theme_id.title()),
+        "description": THEME_INFO.get(theme_id, {}).get("description", ""),
+        "style": THEME_INFO.get(theme_id, {}).get("style", ""),
+    }
+    for theme_id in THEMES
+]
+
+# Overlay scene item ids don't change until the source is removed: scene -> item_id
+_overlay_item_ids: dict[str, int] = {}
+
+# Overlay query string booleans
+_BOOL_STR = {True: "true", False: "false"}
 
+
+@lru_cache(maxsize=8)
 def _get_theme_path(theme: str) -> Path:
     """Get the path to a theme HTML file."""
-    assets_dir = Path(__file__).parent.parent.parent / "assets" / "chat-overlay"
     filename = THEMES.get(theme, THEMES["retro"])
-    return assets_dir / filename
+    return ASSETS_DIR / filename
+
+
+# Theme files ship with the package, so they're checked once per process
+@lru_cache(maxsize=1)
+def _available_themes() -> dict[str, bool]:
+    """Whether each theme's HTML file exists."""
+    return {theme_id: (ASSETS_DIR / filename).exists() for theme_id, filename in THEMES.items()}
+
+
+def _set_overlay_visible(client, scene: str, visible: bool) -> None:
+    """Show or hide the overlay, looking its item id up once per scene.
+
+    The enabled flag itself is always sent: it can be toggled by hand in
+    OBS, so a cached copy could be wrong.
+    """
+    item_id = _overlay_item_ids.get(scene)
+    if item_id is None:
+        item_id = client.client.get_scene_item_id(scene, CHAT_OVERLAY_SOURCE).scene_item_id
+        _overlay_item_ids[scene] = item_id
+    try:
+        client.set_scene_item_enabled(scene, item_id, visible)
+    except Exception:
+        # Stale id (source removed or recreated); look it up again next time
+        _overlay_item_ids.pop(scene, None)
+        raise
 
 
+# Only a handful of overlay configurations are used in practice
+@lru_cache(maxsize=64)
 def _build_overlay_url(
     theme: str = "retro",
     fade_seconds: int = 60,
@@ -48,12 +125,12 @@ def _build_overlay_url(
 
     params = {
         "fade": fade_seconds,
-        "avatars": "true" if show_avatars else "false",
+        "avatars": _BOOL_STR[show_avatars],
         "size": font_size,
         "dir": direction,
         "bg": background,
         "maxmsgs": max_messages,
-        "scanlines": "true" if scanlines else "false",
+        "scanlines": _BOOL_STR[scanlines],
         "sse": f"http://localhost:{sse_port}/events",
     }
 
@@ -112,15 +189,7 @@ def show_chat_overlay(
     logger.debug(f"Overlay URL: {url}")
 
     # Calculate position
-    positions = {
-        "bottom-left": (20, None, None, 20),   # left, top, right, bottom
-        "bottom-right": (None, None, 20, 20),
-        "left": (20, 100, None, 100),
-        "right": (None, 100, 20, 100),
-        "top-left": (20, 20, None, None),
-        "top-right": (None, 20, 20, None),
-    }
-    pos = positions.get(position, positions["bottom-left"])
+    pos = OVERLAY_POSITIONS.get(position, OVERLAY_POSITIONS["bottom-left"])
 
     try:
         # Try to update existing source
@@ -131,13 +200,13 @@ def show_chat_overlay(
         })
         # Make sure it's visible
         try:
-            item_id = client.client.get_scene_item_id(scene, CHAT_OVERLAY_SOURCE).scene_item_id
-            client.set_scene_item_enabled(scene, item_id, True)
+            _set_overlay_visible(client, scene, True)
         except Exception:
             pass
         logger.info("Updated existing chat overlay")
     except Exception:
         # Create new browser source
+        _overlay_item_ids.clear()
         client.create_browser_source(scene, CHAT_OVERLAY_SOURCE, url, width, height)
         logger.info("Created new chat overlay source")
 
@@ -181,8 +250,7 @@ def hide_chat_overlay() -> dict:
     scene = client.get_current_scene()
 
     try:
-        item_id = client.client.get_scene_item_id(scene, CHAT_OVERLAY_SOURCE).scene_item_id
-        client.set_scene_item_enabled(scene, item_id, False)
+        _set_overlay_visible(client, scene, False)
         logger.info("Chat overlay hidden")
         return {"status": "hidden", "source_name": CHAT_OVERLAY_SOURCE}
     except Exception as e:
@@ -200,6 +268,7 @@ def remove_chat_overlay() -> dict:
     """
     client = get_obs_client()
 
+    _overlay_item_ids.clear()
     try:
         client.remove_source(CHAT_OVERLAY_SOURCE)
         logger.info("Chat overlay removed")
@@ -275,12 +344,19 @@ def get_chat_overlay_status() -> dict:
     sse = get_sse_server()
     chat_filter = get_chat_filter()
 
-    # Check if overlay exists and is visible
+    # Check if overlay exists and is visible (one scene item list request
+    # gives both the item id and its enabled flag)
     overlay_status = "not_found"
     try:
-        item_id = client.client.get_scene_item_id(scene, CHAT_OVERLAY_SOURCE).scene_item_id
-        item_info = client.client.get_scene_item_enabled(scene, item_id)
-        overlay_status = "visible" if item_info.scene_item_enabled else "hidden"
+        item = next(
+            (i for i in client.get_scene_items(scene) if i["name"] == CHAT_OVERLAY_SOURCE),
+            None,
+        )
+        if item:
+            overlay_status = "visible" if item["enabled"] else "hidden"
+            _overlay_item_ids[scene] = item["id"]
+        else:
+            _overlay_item_ids.pop(scene, None)
     except Exception:
         pass
 
@@ -310,36 +386,5 @@ def list_chat_themes() -> list[dict]:
     Returns:
         List of theme info dicts.
     """
-    themes = []
-    assets_dir = Path(__file__).parent.parent.parent / "assets" / "chat-overlay"
-
-    theme_info = {
-        "retro": {
-            "name": "Retro",
-            "description": "Neon colors with CRT scanline effect. Great for general streaming.",
-            "style": "Cyberpunk / 80s arcade",
-        },
-        "jrpg": {
-            "name": "JRPG",
-            "description": "Pixel art text boxes inspired by classic Japanese RPGs.",
-            "style": "Retro gaming / 16-bit era",
-        },
-        "minimal": {
-            "name": "Minimal",
-            "description": "Clean, transparent design that stays out of the way.",
-            "style": "Modern / Professional",
-        },
-    }
-
-    for theme_id, filename in THEMES.items():
-        info = theme_info.get(theme_id, {})
-        path = assets_dir / filename
-        themes.append({
-            "id": theme_id,
-            "name": info.get("name", theme_id.title()),
-            "description": info.get("description", ""),
-            "style": info.get("style", ""),
-            "available": path.exists(),
-        })
-
-    return themes
+    available = _available_themes()
+    return [{**theme, "available": available[theme["id"]]} for theme in _THEME_LIST]
@@ -8,7 +8,6 @@ Provides tools for:
 - Analyzing clip content
 """
 
-import base64
 import time
 
 from ..app import mcp, get_obs_client, get_twitch_client
@@ -293,14 +292,14 @@ def play_clip_on_stream(
         pass
 
     # Determine if it's a local file or URL
-    if clip_url.startswith("/") or clip_url.startswith("~"):
+    if clip_url.startswith(("/", "~")):
         # Local file - use media source
         obs.create_media_source(scene, source_name, clip_url, loop=False)
         source_type = "media"
     else:
         # URL - use browser source for Twitch embeds
         # Add autoplay parameters if it's a Twitch clip
-        if "clips.twitch.tv" in clip_url or "twitch.tv" in clip_url:
+        if "twitch.tv" in clip_url:
             if "?" in clip_url:
                 clip_url += "&parent=localhost&autoplay=true"
             else:
@@ -363,8 +362,7 @@ def capture_clip_frame(source_name: str = "") -> dict:
     if not source_name:
         source_name = None
 
-    image_bytes = obs.get_screenshot(source_name)
-    image_b64 = base64.b64encode(image_bytes).decode("utf-8")
+    image_b64 = obs.get_screenshot_base64(source_name)
 
     return {
         "status": "captured",
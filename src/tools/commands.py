@@ -10,9 +10,12 @@ Provides a framework for handling chat commands like:
 Commands can be enabled/disabled and customized.
 """
 
+import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import cache
 from typing import Callable
 
 from ..app import mcp, get_twitch_client, get_obs_client
@@ -20,9 +23,25 @@ from ..utils.logger import get_logger
 
 logger = get_logger("commands")
 
-# Command registry
+# Command registry, by lowercased primary name
 _commands: dict[str, "ChatCommand"] = {}
-_command_cooldowns: dict[str, float] = {}  # user:command -> last_used timestamp
+# Lowercased alias -> primary name
+_aliases: dict[str, str] = {}
+# !commands reply; cleared whenever a command is registered or toggled
+_commands_response: str | None = None
+# Per-user token buckets: (username, command) -> (tokens, monotonic time of last refill),
+# least recently used first; capped so a long stream's chatters don't pile up
+_command_cooldowns: OrderedDict[tuple[str, str], tuple[float, float]] = OrderedDict()
+MAX_COOLDOWN_ENTRIES = 10_000
+
+# Uses a user can fire back to back before the cooldown paces them; each
+# cooldown_seconds earns one use back
+COMMAND_BURST = 1
+
+# Stream info shared by !uptime/!title/!game/!ask, so a burst of them costs
+# one Helix call; "started_ts" is started_at as a Unix timestamp, parsed once per fetch
+STREAM_INFO_CACHE_TTL = 10.0  # seconds
+_stream_info_cache: dict = {"value": None, "started_ts": None, "expires_at": 0.0}
 
 
 @dataclass
@@ -37,22 +56,79 @@ class ChatCommand:
     aliases: list[str] = field(default_factory=list)
 
 
+# "!name rest of message" -> (name, rest); whitespace after "!" is tolerated
+_COMMAND_RE = re.compile(r"!\s*(\S+)\s*(.*)", re.DOTALL)
+
+
+def parse_command(message: str) -> tuple[str, str] | None:
+    """Split a chat command into (lowercased name, args), or None if not one."""
+    match = _COMMAND_RE.match(message)
+    if not match:
+        return None
+    return match.group(1).lower(), match.group(2)
+
+
+def _add_command(command: ChatCommand) -> None:
+    """Add a command and its aliases to the registry."""
+    global _commands_response
+    _commands_response = None
+    name = command.name.lower()
+    _commands[name] = command
+    # A primary name wins over an alias registered earlier
+    _aliases.pop(name, None)
+    for alias in command.aliases:
+        _aliases[alias.lower()] = name
+
+
 def register_command(command: ChatCommand) -> None:
     """Register a chat command."""
-    _commands[command.name.lower()] = command
-    for alias in command.aliases:
-        _commands[alias.lower()] = command
+    _ensure_builtins()
+    _add_command(command)
     logger.info(f"Registered command: !{command.name}")
 
 
+def get_command(name: str) -> ChatCommand | None:
+    """Look up a command by name or alias (case-insensitive)."""
+    _ensure_builtins()
+    name = name.lower()
+    command = _commands.get(name)
+    if command is None and name in _aliases:
+        command = _commands.get(_aliases[name])
+    return command
+
+
 def _check_cooldown(username: str, command_name: str, cooldown: int) -> bool:
-    """Check if user is on cooldown for this command."""
-    key = f"{username}:{command_name}"
-    last_used = _command_cooldowns.get(key, 0)
-    if time.time() - last_used < cooldown:
-        return False
-    _command_cooldowns[key] = time.time()
-    return True
+    """Take a use from the user's token bucket for this command, if one is left."""
+    key = (username, command_name)
+    now = time.monotonic()
+    state = _command_cooldowns.get(key)
+    if state is None or cooldown <= 0:
+        tokens = float(COMMAND_BURST)
+    else:
+        tokens, refilled_at = state
+        tokens = min(float(COMMAND_BURST), tokens + (now - refilled_at) / cooldown)
+    allowed = tokens >= 1
+    _command_cooldowns[key] = (tokens - 1 if allowed else tokens, now)
+    _command_cooldowns.move_to_end(key)
+    if len(_command_cooldowns) > MAX_COOLDOWN_ENTRIES:
+        # An evicted bucket was idle longest, so it would have refilled anyway
+        _command_cooldowns.popitem(last=False)
+    return allowed
+
+
+def _cached_stream_info() -> dict | None:
+    """Current stream info (None if offline), cached for STREAM_INFO_CACHE_TTL seconds."""
+    now = time.monotonic()
+    if now < _stream_info_cache["expires_at"]:
+        return _stream_info_cache["value"]
+    stream = get_twitch_client().get_stream_info()
+    started_at = stream.get("started_at", "") if stream else ""
+    _stream_info_cache["value"] = stream
+    _stream_info_cache["started_ts"] = (
+        datetime.fromisoformat(started_at.replace("Z", "+00:00")).timestamp() if started_at else None
+    )
+    _stream_info_cache["expires_at"] = now + STREAM_INFO_CACHE_TTL
+    return stream
 
 
 # =============================================================================
@@ -73,16 +149,12 @@ def _handle_clip(username: str, args: str) -> str | None:
 
 def _handle_uptime(username: str, args: str) -> str | None:
     """Handle !uptime command - show stream uptime."""
-    client = get_twitch_client()
-    stream = client.get_stream_info()
+    stream = _cached_stream_info()
     if stream:
-        started_at = stream.get("started_at", "")
-        if started_at:
-            # Parse ISO format
-            start = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
-            uptime = datetime.now(start.tzinfo) - start
-            hours = int(uptime.total_seconds() // 3600)
-            minutes = int((uptime.total_seconds() % 3600) // 60)
+        start_ts = _stream_info_cache["started_ts"]
+        if start_ts:
+            hours, remainder = divmod(int(time.time() - start_ts), 3600)
+            minutes = remainder // 60
             if hours > 0:
                 return f"Stream has been live for {hours}h {minutes}m"
             return f"Stream has been live for {minutes} minutes"
@@ -115,8 +187,11 @@ def _handle_socials(username: str, args: str) -> str | None:
 
 def _handle_commands(username: str, args: str) -> str | None:
     """Handle !commands - list available commands."""
-    enabled = [f"!{cmd.name}" for cmd in set(_commands.values()) if cmd.enabled]
-    return f"Available commands: {', '.join(sorted(enabled))}"
+    global _commands_response
+    if _commands_response is None:
+        enabled = sorted(f"!{cmd.name}" for cmd in _commands.values() if cmd.enabled)
+        _commands_response = f"Available commands: {', '.join(enabled)}"
+    return _commands_response
 
 
 def _handle_shoutout(username: str, args: str) -> str | None:
@@ -131,8 +206,7 @@ def _handle_shoutout(username: str, args: str) -> str | None:
 
 def _handle_title(username: str, args: str) -> str | None:
     """Handle !title command - show or set stream title (mod only to set)."""
-    client = get_twitch_client()
-    stream = client.get_stream_info()
+    stream = _cached_stream_info()
     if stream:
         return f"Title: {stream.get('title', 'Unknown')}"
     return "Stream is not currently live"
@@ -140,8 +214,7 @@ def _handle_title(username: str, args: str) -> str | None:
 
 def _handle_game(username: str, args: str) -> str | None:
     """Handle !game command - show current game."""
-    client = get_twitch_client()
-    stream = client.get_stream_info()
+    stream = _cached_stream_info()
     if stream:
         return f"Currently playing: {stream.get('game_name', 'Unknown')}"
     return "Stream is not currently live"
@@ -155,8 +228,7 @@ def _handle_ask(username: str, args: str) -> str | None:
     ai = get_chat_ai()
     # Update context with current stream info
     try:
-        client = get_twitch_client()
-        stream = client.get_stream_info()
+        stream = _cached_stream_info()
         if stream:
             ai.set_context(
                 game=stream.get("game_name", ""),
@@ -247,11 +319,14 @@ def _register_builtin_commands():
     ]
 
     for cmd in commands:
-        register_command(cmd)
+        _add_command(cmd)
+    logger.info(f"Registered {len(commands)} built-in commands")
 
 
-# Register on module load
-_register_builtin_commands()
+@cache
+def _ensure_builtins() -> None:
+    """Register the built-in commands on first use of the registry."""
+    _register_builtin_commands()
 
 
 # =============================================================================
@@ -274,14 +349,12 @@ def handle_chat_command(username: str, message: str) -> dict:
     Returns:
         Dict with status and response (if any).
     """
-    if not message.startswith("!"):
+    parsed = parse_command(message)
+    if not parsed:
         return {"status": "ignored", "reason": "Not a command"}
+    command_name, args = parsed
 
-    parts = message[1:].split(maxsplit=1)
-    command_name = parts[0].lower()
-    args = parts[1] if len(parts) > 1 else ""
-
-    command = _commands.get(command_name)
+    command = get_command(command_name)
     if not command:
         return {"status": "unknown", "command": command_name}
 
@@ -318,20 +391,18 @@ def list_commands() -> list[dict]:
     Returns:
         List of command info dicts.
     """
-    seen = set()
-    commands = []
-    for cmd in _commands.values():
-        if cmd.name in seen:
-            continue
-        seen.add(cmd.name)
-        commands.append({
+    _ensure_builtins()
+    commands = [
+        {
             "name": cmd.name,
             "description": cmd.description,
             "aliases": cmd.aliases,
             "cooldown_seconds": cmd.cooldown_seconds,
             "mod_only": cmd.mod_only,
             "enabled": cmd.enabled,
-        })
+        }
+        for cmd in _commands.values()
+    ]
     return sorted(commands, key=lambda c: c["name"])
 
 
@@ -347,11 +418,13 @@ def toggle_command(command_name: str, enabled: bool) -> dict:
     Returns:
         Status dict.
     """
-    command = _commands.get(command_name.lower())
+    global _commands_response
+    command = get_command(command_name)
     if not command:
         return {"status": "error", "message": f"Unknown command: {command_name}"}
 
     command.enabled = enabled
+    _commands_response = None
     return {
         "status": "success",
         "command": command_name,
@@ -371,7 +444,7 @@ def set_command_cooldown(command_name: str, cooldown_seconds: int) -> dict:
     Returns:
         Status dict.
     """
-    command = _commands.get(command_name.lower())
+    command = get_command(command_name)
     if not command:
         return {"status": "error", "message": f"Unknown command: {command_name}"}
 
@@ -2,14 +2,69 @@
 Chat command handlers for Twitch chat.
 """
 
-import asyncio
+import threading
+import time
 from pathlib import Path
+from urllib.parse import quote
 
 from ..app import mcp, get_obs_client, get_twitch_client
 
+# Lurk overlay page, with the (URL-quoted) username filled in per call
+LURK_URL_TEMPLATE = f"file://{Path(__file__).parent.parent.parent / 'assets' / 'lurk-animation.html'}?user={{user}}"
 
-# Track active lurk overlay
-_lurk_hide_task = None
+LURK_SOURCE = "mcp-lurk-overlay"
+
+# Pending auto-hide of the lurk overlay
+_lurk_hide_timer: threading.Timer | None = None
+
+# Scene item ids don't change until the source is removed: (scene, source) -> id
+_scene_item_ids: dict[tuple[str, str], int] = {}
+
+# Program scene, reused briefly across back-to-back !lurk calls
+SCENE_CACHE_TTL = 1.0  # seconds
+_scene_cache: dict = {"value": "", "expires_at": 0.0}
+
+
+def _current_scene(obs) -> str:
+    """Current program scene, cached for SCENE_CACHE_TTL seconds."""
+    now = time.monotonic()
+    if _scene_cache["value"] and now < _scene_cache["expires_at"]:
+        return _scene_cache["value"]
+    scene = obs.get_current_scene()
+    _scene_cache["value"] = scene
+    _scene_cache["expires_at"] = now + SCENE_CACHE_TTL
+    return scene
+
+
+def _hide_lurk(obs, scene: str) -> None:
+    """Timer callback: hide the lurk overlay, ignoring OBS errors."""
+    try:
+        _set_lurk_visible(obs, scene, False)
+    except Exception:
+        pass
+
+
+def _cancel_hide_timer() -> None:
+    """Cancel any pending auto-hide."""
+    global _lurk_hide_timer
+    if _lurk_hide_timer:
+        _lurk_hide_timer.cancel()
+        _lurk_hide_timer = None
+
+
+def _set_lurk_visible(obs, scene: str, visible: bool) -> None:
+    """Show or hide the lurk overlay, looking its item id up once per scene."""
+    key = (scene, LURK_SOURCE)
+    item_id = _scene_item_ids.get(key)
+    if item_id is None:
+        item_id = obs.client.get_scene_item_id(scene, LURK_SOURCE).scene_item_id
+        _scene_item_ids[key] = item_id
+    try:
+        obs.set_scene_item_enabled(scene, item_id, visible)
+    except Exception:
+        # Stale id (source removed or recreated); look it up again next time
+        _scene_item_ids.pop(key, None)
+        raise
 
 
 @mcp.tool()
@@ -21,42 +76,32 @@ def show_lurk_animation(username: str, duration_seconds: int = 10) -> str:
         username: The username of the lurker
         duration_seconds: How long to show the animation (default: 10)
     """
-    global _lurk_hide_task
+    global _lurk_hide_timer
 
     obs = get_obs_client()
-    scene = obs.get_current_scene()
+    scene = _current_scene(obs)
 
     # Build URL with username parameter
-    html_path = Path(__file__).parent.parent.parent / "assets" / "lurk-animation.html"
-    url = f"file://{html_path}?user={username}"
+    url = LURK_URL_TEMPLATE.format(user=quote(username))
 
     # Try to edit existing source, create if doesn't exist
     try:
-        obs.set_input_settings("mcp-lurk-overlay", {"url": url})
+        obs.set_input_settings(LURK_SOURCE, {"url": url})
         # Make sure it's visible
         try:
-            item_id = obs.client.get_scene_item_id(scene, "mcp-lurk-overlay").scene_item_id
-            obs.set_scene_item_enabled(scene, item_id, True)
+            _set_lurk_visible(obs, scene, True)
         except Exception:
             pass
     except Exception:
         # Source doesn't exist, create it
-        obs.create_browser_source(scene, "mcp-lurk-overlay", url, 1920, 1080)
-
-    # Cancel any existing hide task
-    if _lurk_hide_task and not _lurk_hide_task.done():
-        _lurk_hide_task.cancel()
+        _scene_item_ids.clear()
+        obs.create_browser_source(scene, LURK_SOURCE, url, 1920, 1080)
 
-    # Schedule hiding
-    async def hide_after_delay():
-        await asyncio.sleep(duration_seconds)
-        try:
-            item_id = obs.client.get_scene_item_id(scene, "mcp-lurk-overlay").scene_item_id
-            obs.set_scene_item_enabled(scene, item_id, False)
-        except Exception:
-            pass
-
-    _lurk_hide_task = asyncio.create_task(hide_after_delay())
+    # Replace any pending hide with one for this lurker
+    _cancel_hide_timer()
+    _lurk_hide_timer = threading.Timer(duration_seconds, _hide_lurk, args=(obs, scene))
+    _lurk_hide_timer.daemon = True
+    _lurk_hide_timer.start()
 
     return f"Showing lurk animation for {username} for {duration_seconds}s"
 
@@ -64,18 +109,14 @@ def show_lurk_animation(username: str, duration_seconds: int = 10) -> str:
 @mcp.tool()
 def hide_lurk_animation() -> str:
     """Hide the lurk animation immediately."""
-    global _lurk_hide_task
-
     obs = get_obs_client()
-    scene = obs.get_current_scene()
+    scene = _current_scene(obs)
 
-    # Cancel any pending hide task
-    if _lurk_hide_task and not _lurk_hide_task.done():
-        _lurk_hide_task.cancel()
+    # Cancel any pending hide
+    _cancel_hide_timer()
 
     try:
-        item_id = obs.client.get_scene_item_id(scene, "mcp-lurk-overlay").scene_item_id
-        obs.set_scene_item_enabled(scene, item_id, False)
+        _set_lurk_visible(obs, scene, False)
         return "Lurk animation hidden"
     except Exception:
         return "No lurk animation to hide"
@@ -2,8 +2,6 @@
 OBS Studio control tools.
 """
 
-import base64
-
 from ..app import mcp, get_obs_client, refresh_obs_client
 
 
@@ -384,8 +382,7 @@ def obs_screenshot(source_name: str = "") -> str:
     client = get_obs_client()
     if not source_name:
         source_name = None
-    image_bytes = client.get_screenshot(source_name)
-    return base64.b64encode(image_bytes).decode("utf-8")
+    return client.get_screenshot_base64(source_name)
 
 
 @mcp.tool()
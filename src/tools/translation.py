@@ -7,7 +7,6 @@ Provides both manual tools (translate_screenshot, translate_and_overlay)
 and automatic background service (translation_service_start/stop/status).
 """
 
-import base64
 import asyncio
 import json
 import logging
@@ -36,9 +35,8 @@ def translate_screenshot() -> dict:
         dict with 'image_base64' key containing the screenshot
     """
     client = get_obs_client()
-    image_bytes = client.get_screenshot()
     return {
-        "image_base64": base64.b64encode(image_bytes).decode("utf-8"),
+        "image_base64": client.get_screenshot_base64(),
         "instruction": "Please OCR any Japanese text visible in this game screenshot and provide an English translation. Return format: {japanese: '...', english: '...'}"
     }
 
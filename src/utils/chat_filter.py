@@ -57,6 +57,12 @@ DEFAULT_BOTS = [
     "soundalerts",
 ]
 
+# Link detection for block_links
+_LINK_RE = re.compile(r"https?://|www\.|[a-zA-Z0-9-]+\.(com|org|net|io|gg|tv|co|me)", re.IGNORECASE)
+
+# A leading global flag group such as "(?i)", which can't appear mid-alternation
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
+
 # Common bad words (basic list - users should extend)
 DEFAULT_BAD_WORDS = [
     # Slurs and hate speech patterns would go here
@@ -98,13 +104,54 @@ class ChatFilter:
         if not self.blocked_words:
             self.blocked_words = list(DEFAULT_BAD_WORDS)
 
-        # Compile regex patterns for performance
+        self._set_patterns(self.blocked_patterns)
+        self._compile_words()
+
+    def _set_patterns(self, patterns: list[str]) -> None:
+        """Compile each blocked pattern, dropping invalid ones, then rebuild the matchers."""
         self._compiled_patterns = []
-        for pattern in self.blocked_patterns:
+        for pattern in patterns:
             try:
                 self._compiled_patterns.append(re.compile(pattern, re.IGNORECASE))
             except re.error as e:
                 logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+        self._compile_patterns()
+
+    def _compile_patterns(self) -> None:
+        """
+        Combine the group-free blocked patterns into one alternation.
+
+        Patterns with capture groups keep their own compiled regex, since
+        joining them would renumber groups (breaking backreferences) and
+        clash on repeated group names.
+        """
+        parts = []
+        self._grouped_patterns = []
+        for compiled in self._compiled_patterns:
+            if compiled.groups:
+                self._grouped_patterns.append(compiled)
+                continue
+            pattern = compiled.pattern
+            # Turn a leading "(?i)" into a scoped "(?i:...)" group
+            match = _GLOBAL_FLAGS_RE.match(pattern)
+            if match:
+                pattern = f"(?{match.group(1)}:{pattern[match.end():]})"
+            parts.append(f"(?:{pattern})")
+        self._pattern_re = None
+        if parts:
+            try:
+                self._pattern_re = re.compile("|".join(parts), re.IGNORECASE)
+            except re.error:
+                # Something that only compiles on its own; search those one by one
+                self._grouped_patterns = list(self._compiled_patterns)
+
+    def _compile_words(self) -> None:
+        """Combine the blocked words into one word-boundary alternation."""
+        if self.blocked_words:
+            words = "|".join(map(re.escape, self.blocked_words))
+            self._word_re = re.compile(rf"\b(?:{words})\b", re.IGNORECASE)
+        else:
+            self._word_re = None
 
     def process(self, message: dict) -> dict | None:
         """
@@ -214,34 +261,26 @@ class ChatFilter:
     def _is_caps_abuse(self, text: str) -> bool:
         """Check if message has too many capital letters."""
         # Only check messages with enough letters
-        letters = [c for c in text if c.isalpha()]
-        if len(letters) < 10:
+        letters = sum(map(str.isalpha, text))
+        if letters < 10:
             return False
 
-        caps = sum(1 for c in letters if c.isupper())
-        return (caps / len(letters)) > self.caps_threshold
+        caps = sum(map(str.isupper, text))
+        return (caps / letters) > self.caps_threshold
 
     def _matches_blocked_pattern(self, text: str) -> bool:
         """Check if message matches any blocked regex pattern."""
-        for pattern in self._compiled_patterns:
-            if pattern.search(text):
-                return True
-        return False
+        if self._pattern_re is not None and self._pattern_re.search(text):
+            return True
+        return any(p.search(text) for p in self._grouped_patterns)
 
     def _contains_bad_word(self, text: str) -> bool:
         """Check if message contains blocked words."""
-        text_lower = text.lower()
-        for word in self.blocked_words:
-            # Word boundary check
-            pattern = rf"\b{re.escape(word)}\b"
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return True
-        return False
+        return self._word_re is not None and self._word_re.search(text) is not None
 
     def _contains_link(self, text: str) -> bool:
         """Check if message contains a URL."""
-        url_pattern = r"https?://|www\.|[a-zA-Z0-9-]+\.(com|org|net|io|gg|tv|co|me)"
-        return bool(re.search(url_pattern, text, re.IGNORECASE))
+        return _LINK_RE.search(text) is not None
 
     # Configuration methods
 
@@ -249,6 +288,7 @@ class ChatFilter:
         """Add a word to the blocklist."""
         if word.lower() not in [w.lower() for w in self.blocked_words]:
             self.blocked_words.append(word)
+            self._compile_words()
             logger.info(f"Added blocked word: {word}")
 
     def remove_blocked_word(self, word: str) -> bool:
@@ -256,6 +296,7 @@ class ChatFilter:
         for i, w in enumerate(self.blocked_words):
             if w.lower() == word.lower():
                 self.blocked_words.pop(i)
+                self._compile_words()
                 logger.info(f"Removed blocked word: {word}")
                 return True
         return False
@@ -264,13 +305,14 @@ class ChatFilter:
         """Add a regex pattern to the blocklist."""
         try:
             compiled = re.compile(pattern, re.IGNORECASE)
-            self._compiled_patterns.append(compiled)
-            self.blocked_patterns.append(pattern)
-            logger.info(f"Added blocked pattern: {pattern}")
-            return True
         except re.error as e:
             logger.warning(f"Invalid regex pattern '{pattern}': {e}")
             return False
+        self.blocked_patterns.append(pattern)
+        self._compiled_patterns.append(compiled)
+        self._compile_patterns()
+        logger.info(f"Added blocked pattern: {pattern}")
+        return True
 
     def add_blocked_bot(self, username: str) -> None:
         """Add a bot username to the blocklist."""
@@ -298,6 +340,10 @@ class ChatFilter:
             if hasattr(self, key):
                 setattr(self, key, value)
                 logger.info(f"Updated filter config: {key}={value}")
+        if "blocked_patterns" in kwargs:
+            self._set_patterns(self.blocked_patterns)
+        if "blocked_words" in kwargs:
+            self._compile_words()
         return self.get_config()
 
 
@@ -5,6 +5,7 @@ Connects to IRC and logs all incoming messages.
 """
 
 import os
+import queue
 import re
 import socket
 import ssl
@@ -20,6 +21,13 @@ from .twitch_auth import get_valid_token
 
 logger = get_logger("chat_listener")
 
+# Outgoing chat: Twitch allows 20 messages per 30 seconds for regular users.
+# Messages queued within SEND_COALESCE_WINDOW go out in a single write.
+SEND_RATE_LIMIT = 20
+SEND_RATE_PERIOD = 30.0  # seconds
+SEND_COALESCE_WINDOW = 0.05  # seconds
+SEND_QUEUE_MAXSIZE = 100
+
 
 @dataclass
 class ChatListener:
@@ -32,12 +40,18 @@ class ChatListener:
     _thread: threading.Thread | None = None
     _running: bool = False
     _handlers: list[Callable[[ChatMessage], None]] = None
+    _outbound: queue.Queue | None = None
+    _sender_thread: threading.Thread | None = None
+    _connected: threading.Event | None = None
 
     def __post_init__(self):
         if not self.nick:
             self.nick = self.channel
         if self._handlers is None:
             self._handlers = []
+        self._outbound = queue.Queue(maxsize=SEND_QUEUE_MAXSIZE)
+        # Set while the IRC socket is joined and usable
+        self._connected = threading.Event()
 
     def add_handler(self, handler: Callable[[ChatMessage], None]) -> None:
         """Add a message handler."""
@@ -82,6 +96,7 @@ class ChatListener:
 
         # Join channel
         self._socket.send(f"JOIN #{self.channel}\r\n".encode())
+        self._connected.set()
         logger.debug("IRC connection established")
 
     def _parse_message(self, raw: str) -> ChatMessage | None:
@@ -133,8 +148,8 @@ class ChatListener:
             try:
                 data = self._socket.recv(4096).decode("utf-8", errors="ignore")
                 if not data:
-                    # Connection closed
-                    break
+                    # Server closed the connection; reconnect like any other error
+                    raise ConnectionError("connection closed by server")
 
                 buffer += data
 
@@ -163,10 +178,18 @@ class ChatListener:
                 # Normal timeout, just continue
                 continue
             except Exception as e:
+                self._connected.clear()
                 if self._running:
                     logger.error(f"Chat listener error: {e}")
+                    # Drop any partial line from the dead connection
+                    buffer = ""
                     # Try to refresh token before reconnecting
                     self._refresh_token()
+                    if self._socket:
+                        try:
+                            self._socket.close()
+                        except Exception:
+                            pass
                     backoff = 5
                     for attempt in range(3):
                         logger.info(f"Reconnecting (attempt {attempt + 1}/3) in {backoff}s...")
@@ -188,11 +211,15 @@ class ChatListener:
         # Connection happens in background thread (non-blocking)
         self._thread = threading.Thread(target=self._listen_loop, daemon=True)
         self._thread.start()
+        if not (self._sender_thread and self._sender_thread.is_alive()):
+            self._sender_thread = threading.Thread(target=self._send_loop, daemon=True, name="chat-sender")
+            self._sender_thread.start()
         logger.info(f"Chat listener starting for #{self.channel} (connecting in background)")
 
     def stop(self) -> None:
         """Stop the listener."""
         self._running = False
+        self._connected.clear()
         if self._socket:
             try:
                 self._socket.close()
@@ -206,10 +233,25 @@ class ChatListener:
     def is_running(self) -> bool:
         return self._running
 
+    @property
+    def is_listening(self) -> bool:
+        """Running with a live listen thread (connected or reconnecting)."""
+        return self._running and self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_connected(self) -> bool:
+        """Running with a live IRC socket (not mid-reconnect)."""
+        return self._running and self._connected.is_set()
+
+    def wait_connected(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for the IRC connection; True if connected."""
+        return self._running and self._connected.wait(timeout)
+
     def reconnect_with_token(self, new_token: str) -> None:
         """Reconnect IRC with a new token (called when token is refreshed)."""
         logger.info("Reconnecting chat listener with refreshed token...")
         self.oauth_token = new_token
+        self._connected.clear()
         if self._socket:
             try:
                 self._socket.close()
@@ -220,12 +262,73 @@ class ChatListener:
         # using the updated self.oauth_token
 
     def send_message(self, message: str) -> None:
-        """Send a message through the persistent IRC connection (non-blocking)."""
-        if not self._running or not self._socket:
-            raise RuntimeError("Chat listener not connected - cannot send message")
+        """Queue a message for the persistent IRC connection (non-blocking).
+
+        The sender thread writes it out, respecting Twitch's rate limit.
+        Messages queued while (re)connecting go out once the socket is up.
+        """
+        if not self._running:
+            raise RuntimeError("Chat listener not running - cannot send message")
 
         try:
-            self._socket.send(f"PRIVMSG #{self.channel} :{message}\r\n".encode())
-        except Exception as e:
-            logger.error(f"Failed to send message: {e}")
-            raise
+            self._outbound.put_nowait(message)
+        except queue.Full:
+            logger.error("Outgoing chat queue full, dropping message")
+            raise RuntimeError("Too many chat messages queued - try again shortly")
+
+    def _send_loop(self) -> None:
+        """Drain the outgoing queue through a token bucket, coalescing bursts."""
+        refill_rate = SEND_RATE_LIMIT / SEND_RATE_PERIOD
+        tokens = float(SEND_RATE_LIMIT)
+        refilled_at = time.monotonic()
+
+        while self._running:
+            try:
+                batch = [self._outbound.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+
+            # Pick up anything else sent in the same burst
+            deadline = time.monotonic() + SEND_COALESCE_WINDOW
+            while len(batch) < SEND_RATE_LIMIT:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._outbound.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            while batch and self._running:
+                # Hold the batch across reconnects instead of dropping it
+                if not self._connected.wait(timeout=0.5):
+                    continue
+                now = time.monotonic()
+                tokens = min(float(SEND_RATE_LIMIT), tokens + (now - refilled_at) * refill_rate)
+                refilled_at = now
+                count = min(len(batch), int(tokens))
+                if count == 0:
+                    time.sleep((1 - tokens) / refill_rate)
+                    continue
+
+                lines = "".join(f"PRIVMSG #{self.channel} :{m}\r\n" for m in batch[:count])
+                # reconnect_with_token may clear the socket at any moment
+                sock = self._socket
+                if sock is None:
+                    self._connected.clear()
+                    continue
+                try:
+                    sock.sendall(lines.encode())
+                except Exception as e:
+                    # Keep the batch and retry it once the listener has
+                    # reconnected; closing the socket makes the listen loop
+                    # notice and reconnect
+                    logger.error(f"Failed to send {count} chat message(s), will retry: {e}")
+                    self._connected.clear()
+                    try:
+                        sock.close()
+                    except Exception:
+                        pass
+                    continue
+                tokens -= count
+                del batch[:count]
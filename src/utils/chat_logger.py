@@ -5,9 +5,10 @@ Saves Twitch chat messages to daily log files in JSON format.
 
 import json
 import os
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from .twitch_client import ChatMessage
@@ -15,6 +16,9 @@ if TYPE_CHECKING:
 # Log directory inside the project (git-ignored)
 LOG_DIR = Path(__file__).parent.parent.parent / "logs" / "chat"
 
+# Block size for reading log files backwards from the end
+TAIL_BLOCK_SIZE = 64 * 1024
+
 
 def get_log_path(date: datetime | None = None) -> Path:
     """Get the log file path for a given date."""
@@ -46,30 +50,65 @@ def log_message(msg: "ChatMessage") -> None:
         f.write(json.dumps(entry) + "\n")
 
 
-def read_logs(date: datetime | None = None, limit: int = 100) -> list[dict]:
-    """Read chat logs for a given date."""
+def _read_tail(f, limit: int) -> bytes:
+    """Return the bytes holding the last `limit` lines of a binary file.
+
+    Reads backwards in TAIL_BLOCK_SIZE blocks, so the cost depends on the
+    size of the tail rather than the whole file.
+    """
+    end = f.seek(0, os.SEEK_END)
+    pos = end
+    data = b""
+    # One extra newline: the file normally ends with one
+    while pos > 0 and data.count(b"\n") <= limit:
+        step = min(TAIL_BLOCK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        data = f.read(step) + data
+    return data
+
+
+def iter_logs(date: datetime | None = None, limit: int = 100) -> Iterator[dict]:
+    """Yield chat log entries for a given date (the last `limit`; 0 for all).
+
+    Lines stay bytes until their own json.loads, and only the last `limit`
+    of them are held at once.
+    """
     log_path = get_log_path(date)
 
     if not log_path.exists():
-        return []
+        return
+
+    with open(log_path, "rb") as f:
+        data = _read_tail(f, limit) if limit else f.read()
+
+    lines = (line for line in data.splitlines() if line.strip())
+    if limit:
+        # The first line may be a partial one cut by the block boundary
+        lines = deque(lines, maxlen=limit)
+    for line in lines:
+        yield json.loads(line.decode("utf-8", errors="replace"))
+
+
+def read_logs(date: datetime | None = None, limit: int = 100) -> list[dict]:
+    """Read chat logs for a given date (the last `limit` messages; 0 for all)."""
+    return list(iter_logs(date, limit))
 
-    messages = []
-    with open(log_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                messages.append(json.loads(line))
 
-    return messages[-limit:] if limit else messages
+# (LOG_DIR mtime_ns, dates newest first); a new day's file changes the mtime
+_dates_cache: tuple[int, list[str]] | None = None
 
 
 def get_available_dates() -> list[str]:
     """Get list of dates that have chat logs."""
-    if not LOG_DIR.exists():
+    global _dates_cache
+    try:
+        mtime_ns = LOG_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
 
-    dates = []
-    for f in LOG_DIR.glob("*.jsonl"):
-        dates.append(f.stem)
+    if _dates_cache is None or _dates_cache[0] != mtime_ns:
+        dates = sorted((f.stem for f in LOG_DIR.glob("*.jsonl")), reverse=True)
+        _dates_cache = (mtime_ns, dates)
 
-    return sorted(dates, reverse=True)
+    return list(_dates_cache[1])
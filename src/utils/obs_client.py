@@ -203,6 +203,14 @@ class OBSClient:
 
     def get_screenshot(self, source_name: str | None = None, width: int = 1920, height: int = 1080) -> bytes:
         """Capture screenshot of a source or current scene."""
+        return base64.b64decode(self.get_screenshot_base64(source_name, width, height))
+
+    def get_screenshot_base64(self, source_name: str | None = None, width: int = 1920, height: int = 1080) -> str:
+        """Capture screenshot of a source or current scene as base64 PNG data.
+
+        OBS already sends the image base64-encoded, so this skips the
+        decode/re-encode round trip for callers that want base64 anyway.
+        """
         if source_name is None:
             source_name = self.get_current_scene()
 
@@ -216,8 +224,8 @@ class OBSClient:
         # Remove data URL prefix if present
         data = result.image_data
         if "," in data:
-            data = data.split(",")[1]
-        return base64.b64decode(data)
+            data = data.split(",", 1)[1]
+        return data
 
     def create_browser_source(
         self,
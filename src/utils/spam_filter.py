@@ -69,11 +69,9 @@ class SpamFilter:
         if msg.is_mod or msg.is_subscriber:
             return False
 
-        message_lower = msg.message.lower()
-
-        # Check each spam pattern
+        # Check each spam pattern (compiled IGNORECASE, so no lowered copy)
         for pattern in self.patterns:
-            if pattern.search(message_lower):
+            if pattern.search(msg.message):
                 logger.warning(
                     f"SPAM DETECTED from {msg.username}: {msg.message[:100]} "
                     f"(matched pattern: {pattern.pattern})"
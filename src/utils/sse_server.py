@@ -17,6 +17,30 @@ from .logger import get_logger
 
 logger = get_logger("sse_server")
 
+# Messages handed over from the chat listener thread wait here for the SSE loop
+INBOX_MAXSIZE = 1024
+BROADCAST_BATCH_SIZE = 64
+
+# Messages reaching a client within this window go out in one write
+DEFAULT_FLUSH_INTERVAL_MS = 50
+MAX_FLUSH_INTERVAL_MS = 1000
+
+
+def _validate_config(updates: dict) -> dict:
+    """Check and normalize config updates; raises ValueError for bad values."""
+    if "flush_interval_ms" in updates:
+        value = updates["flush_interval_ms"]
+        if isinstance(value, bool):
+            raise ValueError("flush_interval_ms must be an integer")
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise ValueError("flush_interval_ms must be an integer")
+        if not 0 <= value <= MAX_FLUSH_INTERVAL_MS:
+            raise ValueError(f"flush_interval_ms must be between 0 and {MAX_FLUSH_INTERVAL_MS}")
+        updates = {**updates, "flush_interval_ms": value}
+    return updates
+
 # Global state
 _server: "SSEServer | None" = None
 _runner: web.AppRunner | None = None
@@ -32,6 +56,8 @@ class SSEServer:
     _clients: set = field(default_factory=set)
     _config: dict = field(default_factory=dict)
     _running: bool = False
+    _inbox: asyncio.Queue | None = None
+    _drain_task: asyncio.Task | None = None
 
     def __post_init__(self):
         self._config = {
@@ -42,6 +68,7 @@ class SSEServer:
             "font_size": "medium",
             "direction": "up",
             "background": "transparent",
+            "flush_interval_ms": DEFAULT_FLUSH_INTERVAL_MS,
         }
 
     async def handle_events(self, request: web.Request) -> web.StreamResponse:
@@ -73,7 +100,18 @@ class SSEServer:
                 try:
                     # Wait for message with timeout for keepalive
                     msg = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    event_data = f"data: {json.dumps(msg)}\n\n"
+
+                    # Let a burst accumulate, then send it in one write. Each
+                    # message keeps its own data: frame, so clients that parse
+                    # one object per event are unaffected.
+                    flush_ms = self._config["flush_interval_ms"]
+                    if flush_ms > 0:
+                        await asyncio.sleep(flush_ms / 1000)
+                    batch = [msg]
+                    while len(batch) < BROADCAST_BATCH_SIZE and not queue.empty():
+                        batch.append(queue.get_nowait())
+
+                    event_data = "".join(f"data: {json.dumps(m)}\n\n" for m in batch)
                     await response.write(event_data.encode())
                 except asyncio.TimeoutError:
                     # Send keepalive comment
@@ -97,7 +135,9 @@ class SSEServer:
         elif request.method == "POST":
             try:
                 new_config = await request.json()
-                self._config.update(new_config)
+                if not isinstance(new_config, dict):
+                    raise ValueError("config must be a JSON object")
+                self._config.update(_validate_config(new_config))
                 # Broadcast config update to all clients
                 await self._broadcast_config()
                 return web.json_response({"status": "ok", "config": self._config})
@@ -125,19 +165,44 @@ class SSEServer:
 
     async def broadcast_message(self, message: dict) -> None:
         """Broadcast a chat message to all connected clients."""
+        self._fan_out([message])
+
+    def _fan_out(self, messages: list[dict]) -> None:
+        """Queue a batch of messages for every connected client."""
         if not self._clients:
             return
 
         for queue in self._clients:
-            try:
-                queue.put_nowait(message)
-            except asyncio.QueueFull:
-                # Client is slow, skip this message
-                pass
+            for message in messages:
+                try:
+                    queue.put_nowait(message)
+                except asyncio.QueueFull:
+                    # Client is slow, skip this message
+                    pass
+
+    def start_inbox(self) -> None:
+        """Create the cross-thread inbox and its drain task on the running loop."""
+        self._inbox = asyncio.Queue(maxsize=INBOX_MAXSIZE)
+        self._drain_task = asyncio.create_task(self._drain_inbox())
+
+    def enqueue(self, message: dict) -> None:
+        """Add a message to the inbox. Must run on the SSE loop."""
+        try:
+            self._inbox.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("SSE inbox full, dropping chat message")
+
+    async def _drain_inbox(self) -> None:
+        """Fan inbox messages out to clients, in batches when they pile up."""
+        while True:
+            batch = [await self._inbox.get()]
+            while len(batch) < BROADCAST_BATCH_SIZE and not self._inbox.empty():
+                batch.append(self._inbox.get_nowait())
+            self._fan_out(batch)
 
     def update_config(self, **kwargs) -> dict:
         """Update overlay configuration."""
-        self._config.update(kwargs)
+        self._config.update(_validate_config(kwargs))
         # Schedule broadcast
         asyncio.create_task(self._broadcast_config())
         return self._config
@@ -166,8 +231,9 @@ async def broadcast_message(message: dict) -> None:
 def broadcast_message_sync(message: dict) -> None:
     """Synchronous wrapper for broadcasting (for use from sync handlers).
 
-    Uses run_coroutine_threadsafe to safely schedule the broadcast
-    on the SSE server's event loop from any thread (e.g., chat listener thread).
+    Hands the message to the SSE server's inbox with call_soon_threadsafe,
+    so the calling thread (e.g., chat listener thread) never waits on the
+    SSE event loop.
     """
     if not _server:
         logger.warning("broadcast_message_sync: no SSE server")
@@ -179,13 +245,8 @@ def broadcast_message_sync(message: dict) -> None:
         logger.warning("broadcast_message_sync: SSE event loop not running")
         return
 
-    logger.debug(f"broadcast_message_sync: sending to {_server.client_count} clients: {message.get('username', '?')}")
-    future = asyncio.run_coroutine_threadsafe(_server.broadcast_message(message), _sse_loop)
-    # Check for exceptions (non-blocking)
-    try:
-        future.result(timeout=1.0)
-    except Exception as e:
-        logger.error(f"broadcast_message_sync failed: {e}")
+    logger.debug(f"broadcast_message_sync: queueing for {_server.client_count} clients: {message.get('username', '?')}")
+    _sse_loop.call_soon_threadsafe(_server.enqueue, message)
 
 
 async def start_sse_server(port: int = 8765, host: str = "127.0.0.1") -> SSEServer:
@@ -230,6 +291,7 @@ async def start_sse_server(port: int = 8765, host: str = "127.0.0.1") -> SSEServ
     await site.start()
 
     _server._running = True
+    _server.start_inbox()
     _sse_loop = asyncio.get_event_loop()
     logger.info(f"SSE server started on http://{host}:{port}")
     logger.info(f"  /events - SSE stream for chat overlay")
@@ -248,6 +310,8 @@ async def stop_sse_server() -> None:
         _runner = None
 
     if _server:
+        if _server._drain_task:
+            _server._drain_task.cancel()
         _server._running = False
         _server = None
         logger.info("SSE server stopped")
@@ -17,10 +17,25 @@ logger = get_logger("twitch_auth")
 
 TOKEN_FILE = Path(__file__).parent.parent.parent / ".twitch_token.json"
 
+# One keep-alive connection pool for id.twitch.tv and api.twitch.tv, so
+# chained validate/refresh/Helix calls reuse TLS connections. Retries cover
+# connection failures only, not HTTP error responses.
+http_client = httpx.Client(
+    timeout=10.0,
+    transport=httpx.HTTPTransport(
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        retries=2,
+    ),
+)
+
+# Successful /oauth2/validate responses, reused briefly: token -> (monotonic time, response)
+VALIDATION_CACHE_TTL = 60  # seconds
+_validation_cache: dict[str, tuple[float, dict]] = {}
+
 
 def get_device_code(client_id: str, scopes: list[str]) -> dict:
     """Request a device code from Twitch."""
-    resp = httpx.post(
+    resp = http_client.post(
         "https://id.twitch.tv/oauth2/device",
         data={
             "client_id": client_id,
@@ -33,11 +48,19 @@ def get_device_code(client_id: str, scopes: list[str]) -> dict:
 
 
 def poll_for_token(client_id: str, scopes: list[str], device_code: str, interval: int = 5, timeout: int = 300) -> dict:
-    """Poll Twitch until the user authorizes or timeout."""
-    start_time = time.time()
+    """Poll Twitch until the user authorizes or timeout.
+
+    Starts at the device endpoint's suggested interval and doubles the wait
+    while authorization is pending (capped at the larger of 4x the interval
+    or 30 s), so a user who walks away doesn't keep us hammering the token
+    endpoint. slow_down adds 5 s to the base interval, per RFC 8628.
+    """
+    deadline = time.monotonic() + timeout
+    max_wait = max(interval * 4, 30)
+    wait = interval
 
-    while time.time() - start_time < timeout:
-        resp = httpx.post(
+    while time.monotonic() < deadline:
+        resp = http_client.post(
             "https://id.twitch.tv/oauth2/token",
             data={
                 "client_id": client_id,
@@ -54,12 +77,14 @@ def poll_for_token(client_id: str, scopes: list[str], device_code: str, interval
             # Success!
             return data
         elif data.get("message") == "authorization_pending":
-            # User hasn't authorized yet, wait and retry
-            time.sleep(interval)
+            # User hasn't authorized yet, wait (a bit longer each time) and retry
+            time.sleep(min(wait, max(0.0, deadline - time.monotonic())))
+            wait = min(wait * 2, max_wait)
         elif data.get("message") == "slow_down":
             # We're polling too fast
             interval += 5
-            time.sleep(interval)
+            wait = max(wait, interval)
+            time.sleep(wait)
         else:
             # Some other error
             raise ValueError(f"Token request failed: {data}")
@@ -74,6 +99,7 @@ def save_token(token_data: dict) -> None:
     with open(TOKEN_FILE, "w") as f:
         json.dump(token_data, f, indent=2)
     logger.info(f"Token saved to {TOKEN_FILE}")
+    _validation_cache.clear()
 
 
 def load_token() -> dict | None:
@@ -86,7 +112,7 @@ def load_token() -> dict | None:
 
 def refresh_token(client_id: str, client_secret: str, refresh_token: str) -> dict:
     """Refresh an expired access token."""
-    resp = httpx.post(
+    resp = http_client.post(
         "https://id.twitch.tv/oauth2/token",
         data={
             "client_id": client_id,
@@ -102,7 +128,7 @@ def refresh_token(client_id: str, client_secret: str, refresh_token: str) -> dic
 
 def validate_token(access_token: str) -> dict | None:
     """Validate a token and get info about it."""
-    resp = httpx.get(
+    resp = http_client.get(
         "https://id.twitch.tv/oauth2/validate",
         headers={"Authorization": f"OAuth {access_token}"},
         timeout=10.0,
@@ -112,6 +138,30 @@ def validate_token(access_token: str) -> dict | None:
     return None
 
 
+def validate_token_cached(access_token: str) -> dict | None:
+    """validate_token(), reusing a successful result for VALIDATION_CACHE_TTL seconds.
+
+    The cached expires_in is reduced by the time since validation. Failures
+    aren't cached, so a bad token is re-checked on every call.
+    """
+    now = time.monotonic()
+    cached = _validation_cache.get(access_token)
+    if cached and now - cached[0] < VALIDATION_CACHE_TTL:
+        validated_at, validation = cached
+        elapsed = int(now - validated_at)
+        return {**validation, "expires_in": max(0, validation.get("expires_in", 0) - elapsed)}
+
+    validation = validate_token(access_token)
+    if validation:
+        _validation_cache[access_token] = (now, validation)
+    return validation
+
+
+def invalidate_validation_cache() -> None:
+    """Forget all cached validation results."""
+    _validation_cache.clear()
+
+
 def authenticate(client_id: str, scopes: list[str] | None = None) -> str:
     """
     Full device code authentication flow.
@@ -204,7 +254,7 @@ def get_valid_token(client_id: str, client_secret: str = "", scopes: list[str] |
 
     if existing:
         # Check if token is still valid
-        validation = validate_token(existing.get("access_token", ""))
+        validation = validate_token_cached(existing.get("access_token", ""))
         if validation:
             return existing["access_token"]
 
@@ -4,6 +4,7 @@ Twitch API and IRC client wrapper.
 
 import socket
 import ssl
+import threading
 import time
 from dataclasses import dataclass, field
 from typing import Callable
@@ -13,7 +14,7 @@ import httpx
 from . import chat_logger
 from .logger import get_logger
 from .panel_scraper import get_panel_scraper
-from .twitch_auth import refresh_token, save_token, load_token
+from .twitch_auth import http_client, refresh_token, save_token, load_token
 
 logger = get_logger("twitch_client")
 
@@ -39,12 +40,17 @@ class TwitchClient:
     channel: str
     _user_id: str | None = None
     _chat_messages: list[ChatMessage] = field(default_factory=list)
+    # Replaced (never mutated) under the lock, so receive_message can iterate
+    # its snapshot without locking
     _message_handlers: list[Callable[[ChatMessage], None]] = field(default_factory=list)
+    _handlers_lock: threading.Lock = field(default_factory=threading.Lock)
     # Profile cache: {username: {"data": {profile}, "cached_at": timestamp}}
     _profile_cache: dict[str, dict] = field(default_factory=dict)
     _profile_cache_max_size: int = 20
     _token_expires_at: float = 0.0
     _on_token_refresh: Callable[[str], None] | None = None
+    # Serializes refreshes between API calls and the background refresher
+    _refresh_lock: threading.RLock = field(default_factory=threading.RLock)
 
     def __post_init__(self) -> None:
         """Initialize token expiry from saved token file."""
@@ -62,8 +68,24 @@ class TwitchClient:
             return False  # Unknown expiry, don't preemptively refresh
         return time.time() >= (self._token_expires_at - buffer_seconds)
 
+    def refresh_if_expiring(self, buffer_seconds: int = 300) -> bool:
+        """Refresh the token if it's within buffer_seconds of expiry.
+
+        Returns True only if a refresh happened. Checked under the refresh
+        lock, so a refresh another thread just finished isn't repeated.
+        """
+        with self._refresh_lock:
+            if not self._is_token_expiring(buffer_seconds):
+                return False
+            return self._refresh_token()
+
     def _refresh_token(self) -> bool:
         """Refresh the OAuth token. Returns True if successful."""
+        with self._refresh_lock:
+            return self._refresh_token_locked()
+
+    def _refresh_token_locked(self) -> bool:
+        """Body of _refresh_token(); caller holds _refresh_lock."""
         token_data = load_token()
         if not token_data or not token_data.get("refresh_token"):
             logger.warning("Cannot refresh token: no refresh_token available")
@@ -96,7 +118,7 @@ class TwitchClient:
         # Proactively refresh token if near expiry (within 5 minutes)
         if self._is_token_expiring():
             logger.info("Token expiring soon, proactively refreshing...")
-            self._refresh_token()
+            self.refresh_if_expiring()
 
         # Extract extra headers once (don't pop on each iteration)
         extra_headers = kwargs.pop("headers", {})
@@ -111,7 +133,7 @@ class TwitchClient:
                 **extra_headers,
             }
 
-            resp = getattr(httpx, method)(url, headers=headers, timeout=10.0, **kwargs)
+            resp = getattr(http_client, method)(url, headers=headers, timeout=10.0, **kwargs)
 
             if resp.status_code == 401:
                 logger.warning(f"API call to {url} failed with 401 (attempt {attempt + 1}/3)")
@@ -199,8 +221,16 @@ class TwitchClient:
                 logger.warning(f"Message handler error: {e}")  # Log but don't break chain
 
     def add_message_handler(self, handler: Callable[[ChatMessage], None]) -> None:
-        """Add a handler for incoming chat messages."""
-        self._message_handlers.append(handler)
+        """Add a handler for incoming chat messages (no-op if already added)."""
+        with self._handlers_lock:
+            if handler not in self._message_handlers:
+                self._message_handlers = [*self._message_handlers, handler]
+
+    def remove_message_handler(self, handler: Callable[[ChatMessage], None]) -> None:
+        """Remove a previously added chat message handler, if present."""
+        with self._handlers_lock:
+            if handler in self._message_handlers:
+                self._message_handlers = [h for h in self._message_handlers if h != handler]
 
     def get_stream_info(self) -> dict | None:
         """Get current stream information."""